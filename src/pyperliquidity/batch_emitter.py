@@ -10,8 +10,9 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
-from dataclasses import dataclass
-from typing import Any
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NamedTuple
 
 from pyperliquidity.order_differ import OrderDiff
 from pyperliquidity.order_state import OrderState
@@ -33,8 +34,7 @@ _ALO_ORDER_TYPE: dict[str, Any] = {"limit": {"tif": "Alo"}}
 
 # --- Result type --------------------------------------------------------------
 
-@dataclass(frozen=True, slots=True)
-class EmitResult:
+class EmitResult(NamedTuple):
     """Summary of a single emit() call."""
 
     n_cancelled: int
@@ -53,9 +53,14 @@ def _parse_statuses(response: Any, expected: int) -> list[dict[str, Any]]:
     truncated on first error), the first error is propagated to all
     remaining positions so callers don't silently swallow them.
     """
-    if isinstance(response, dict) and response.get("status") == "ok":
-        data = response.get("response", {}).get("data", {})
-        statuses: list[dict[str, Any]] = data.get("statuses", [])
+    # Direct indexing for the known SDK shape; anything else (error payload,
+    # missing keys, non-dict) is treated as a failed batch.
+    try:
+        ok = response["status"] == "ok"
+        statuses: list[dict[str, Any]] = response["response"]["data"]["statuses"]
+    except (KeyError, TypeError):
+        ok = False
+    if ok:
         if len(statuses) < expected:
             first_error: dict[str, Any] | None = next(
                 (s for s in statuses if "error" in s), None
@@ -97,6 +102,9 @@ class BatchEmitter:
         Monotonic clock (default ``time.monotonic``).
     sz_decimals : int
         Number of decimal places to round order sizes to (default 5).
+
+    SDK calls run on a single long-lived worker thread owned by the
+    emitter; call :meth:`aclose` to release it.
     """
 
     def __init__(
@@ -114,34 +122,75 @@ class BatchEmitter:
         self._order_state = order_state
         self._clock = clock
         self._sz_decimals = sz_decimals
-        self._cooldowns: dict[tuple[str, str], float] = {}
-        self._consecutive_rejects: dict[str, int] = {}
+        # Per-side state indexed by ``int(is_buy)``: 0 = sell, 1 = buy.  The
+        # coin is fixed per emitter, so two slots cover every key.
+        self._cool_expiry: list[float] = [0.0, 0.0]
+        self._consecutive_rejects: list[int] = [0, 0]
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="emitter")
+        # Fixed-shape order request; builders copy it and fill the per-order keys.
+        # Not cached per DesiredOrder: the quoting engine builds fresh orders
+        # every tick and ``sz`` is rounded with this emitter's decimals, so a
+        # prebuilt dict would never be reused.
+        self._order_template: dict[str, Any] = {
+            "coin": coin,
+            "is_buy": False,
+            "sz": 0.0,
+            "limit_px": 0.0,
+            "order_type": _ALO_ORDER_TYPE,
+            "reduce_only": False,
+        }
+
+    # -- Exchange I/O ----------------------------------------------------------
+
+    def _submit(self, fn: Callable[[Any], Any], reqs: Any) -> asyncio.Future[Any]:
+        """Queue a synchronous SDK batch call on the emitter's worker thread."""
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self._executor, fn, reqs)
+
+    @staticmethod
+    def _run_batches(
+        calls: list[tuple[Callable[[Any], Any], Any]],
+    ) -> tuple[list[Any], Exception | None]:
+        """Run SDK batch calls back to back, stopping at the first that raises.
+
+        Runs on the worker thread.  Returns the responses of the calls that
+        completed and the exception that stopped the run, if any.
+        """
+        responses: list[Any] = []
+        for fn, reqs in calls:
+            try:
+                responses.append(fn(reqs))
+            except Exception as exc:
+                return responses, exc
+        return responses, None
+
+    async def aclose(self) -> None:
+        """Release the worker thread.  In-flight calls are not waited on."""
+        self._executor.shutdown(wait=False)
 
     # -- Cooldown management ---------------------------------------------------
 
-    def _is_cooled_down(self, side: str, now: float) -> bool:
-        key = (self.coin, side)
-        expiry = self._cooldowns.get(key)
-        if expiry is None:
-            return False
-        if now >= expiry:
-            del self._cooldowns[key]
-            return False
-        return True
+    def _is_cooled_down(self, is_buy: bool, now: float) -> bool:
+        return now < self._cool_expiry[is_buy]
 
-    def _set_cooldown(self, side: str, duration: float) -> None:
-        self._cooldowns[(self.coin, side)] = self._clock() + duration
+    def _set_cooldown(self, is_buy: bool, duration: float) -> None:
+        self._cool_expiry[is_buy] = self._clock() + duration
 
-    def _clear_cooldown(self, side: str) -> None:
-        self._cooldowns.pop((self.coin, side), None)
+    def _clear_cooldown(self, is_buy: bool) -> None:
+        self._cool_expiry[is_buy] = 0.0
 
     # -- Main entry point ------------------------------------------------------
 
     async def emit(self, diff: OrderDiff, budget: RateLimitBudget) -> EmitResult:
         """Execute an OrderDiff against the exchange.
 
-        Flow: budget gating → priority trimming → cooldown filter →
-        execute cancels → execute modifies → execute places.
+        Flow: priority trimming → cooldown filter → build requests →
+        budget gating (check-and-reserve) → send cancels, modifies, places
+        (stopping at the first batch that raises) → handle responses in
+        that order.
+
+        Each non-empty batch is its own exchange request: Hyperliquid has no
+        action type that mixes cancels, modifies, and new orders.
         """
         n_cancel = len(diff.cancels)
         n_modify = len(diff.modifies)
@@ -151,51 +200,92 @@ class BatchEmitter:
         if total == 0:
             return EmitResult(0, 0, 0, 0, cancel_only_mode=False)
 
-        # Budget gating
-        cancel_only = budget.remaining() < total + SAFETY_MARGIN
-
         cancels = list(diff.cancels)
-        modifies: list[tuple[int, DesiredOrder]] = (
-            [] if cancel_only else list(diff.modifies)
-        )
-        places: list[DesiredOrder] = [] if cancel_only else list(diff.places)
+        modifies: list[tuple[int, DesiredOrder]] = list(diff.modifies)
+        places: list[DesiredOrder] = list(diff.places)
 
         # Priority trimming (cancels never trimmed)
-        if not cancel_only:
-            mut_total = len(cancels) + len(modifies) + len(places)
-            if mut_total > MAX_MUTATIONS_PER_TICK:
-                room = MAX_MUTATIONS_PER_TICK - len(cancels)
-                if room <= 0:
-                    modifies = []
-                    places = []
-                elif len(modifies) <= room:
-                    places = places[: room - len(modifies)]
-                else:
-                    modifies = modifies[:room]
-                    places = []
+        if total > MAX_MUTATIONS_PER_TICK:
+            room = MAX_MUTATIONS_PER_TICK - len(cancels)
+            if room <= 0:
+                modifies = []
+                places = []
+            elif len(modifies) <= room:
+                places = places[: room - len(modifies)]
+            else:
+                modifies = modifies[:room]
+                places = []
 
-        # Cooldown filter on places
+        # Cooldown filter on places — resolve each side's cooldown once
         if places:
             now = self._clock()
-            places = [p for p in places if not self._is_cooled_down(p.side, now)]
+            buy_cool = self._is_cooled_down(True, now)
+            sell_cool = self._is_cooled_down(False, now)
+            if buy_cool or sell_cool:
+                places = [p for p in places if not (buy_cool if p.is_buy else sell_cool)]
+
+        # Build every batch before anything is sent, so a failed cross-side
+        # assertion aborts the tick before the first API call.
+        cancel_reqs = self._build_cancels(cancels) if cancels else []
+        rounded_modifies, modify_reqs = (
+            self._build_modifies(modifies) if modifies else ([], [])
+        )
+        rounded_places, place_reqs = self._build_places(places) if places else ([], [])
+
+        # Budget gating: reserve the modify/place batches only if the budget
+        # covers every mutation in the diff plus SAFETY_MARGIN; otherwise fall
+        # back to cancel-only mode.  Cancels are always sent and paid for below.
+        n_optional = (1 if modify_reqs else 0) + (1 if place_reqs else 0)
+        cancel_only = not budget.try_reserve(
+            n_optional, min_remaining=total + SAFETY_MARGIN,
+        )
+        if cancel_only:
+            modify_reqs = place_reqs = []
+        if cancel_reqs:
+            budget.on_request()
 
-        # Execute in priority order
-        n_cancelled = n_modified = n_placed = n_errors = 0
+        # Hand all batches to the worker thread as one job.  It runs them back
+        # to back in priority order, so the requests go out without an
+        # event-loop round trip in between.  They are deliberately not run
+        # concurrently: cancels must land before placements that rely on the
+        # balance they free, and the SDK derives action nonces from the wall
+        # clock, so parallel signing could collide.  For the same reason the
+        # job stops at the first batch that raises.
+        kinds: list[str] = []
+        calls: list[tuple[Callable[[Any], Any], Any]] = []
+        if cancel_reqs:
+            kinds.append("cancel")
+            calls.append((self._exchange.bulk_cancel, cancel_reqs))
+        if modify_reqs:
+            kinds.append("modify")
+            calls.append((self._exchange.bulk_modify_orders_new, modify_reqs))
+        if place_reqs:
+            kinds.append("place")
+            calls.append((self._exchange.bulk_orders, place_reqs))
+
+        responses, exc = await self._submit(self._run_batches, calls)
 
-        if cancels:
-            ok, err = await self._execute_cancels(cancels, budget)
-            n_cancelled += ok
-            n_errors += err
+        n_cancelled = n_modified = n_placed = n_errors = 0
 
-        if modifies:
-            ok, err = await self._execute_modifies(modifies, budget)
-            n_modified += ok
+        for kind, response in zip(kinds, responses):
+            if kind == "cancel":
+                ok, err = self._handle_cancels(cancels, response)
+                n_cancelled += ok
+            elif kind == "modify":
+                ok, err = self._handle_modifies(rounded_modifies, response)
+                n_modified += ok
+            else:
+                ok, err = self._handle_places(rounded_places, response)
+                n_placed += ok
             n_errors += err
 
-        if places:
-            ok, err = await self._execute_places(places, budget)
-            n_placed += ok
-            n_errors += err
+        if exc is not None:
+            # Cancels are never reserved, so every batch left unsent after
+            # the one that raised is a reserved modify/place: refund it.
+            n_unsent = len(calls) - len(responses) - 1
+            if n_unsent:
+                budget.on_request(-n_unsent)
+            raise exc
 
         return EmitResult(
             n_cancelled=n_cancelled,
@@ -205,20 +295,62 @@ class BatchEmitter:
             cancel_only_mode=cancel_only,
         )
 
-    # -- Batch executors -------------------------------------------------------
+    # -- Request builders ------------------------------------------------------
+
+    def _build_cancels(self, cancel_oids: list[int]) -> list[dict[str, Any]]:
+        return [{"coin": self.coin, "oid": oid} for oid in cancel_oids]
 
-    async def _execute_cancels(
+    def _build_modifies(
         self,
-        cancel_oids: list[int],
-        budget: RateLimitBudget,
-    ) -> tuple[int, int]:
-        reqs = [{"coin": self.coin, "oid": oid} for oid in cancel_oids]
+        modifies: list[tuple[int, DesiredOrder]],
+    ) -> tuple[list[tuple[int, DesiredOrder, float]], list[dict[str, Any]]]:
+        # Cross-side assertion — the whole loop is compiled out under ``-O``.
+        if __debug__:
+            orders_by_oid = self._order_state.orders_by_oid
+            for oid, desired in modifies:
+                tracked = orders_by_oid.get(oid)
+                assert tracked is None or tracked.side == desired.side, (
+                    f"Cross-side modify: oid={oid} tracked_side="
+                    f"{tracked.side if tracked else None} desired_side={desired.side}"
+                )
 
-        try:
-            response = await asyncio.to_thread(self._exchange.bulk_cancel, reqs)
-        finally:
-            budget.on_request()
+        template = self._order_template
+        rounded: list[tuple[int, DesiredOrder, float]] = []
+        reqs: list[dict[str, Any]] = []
+        for oid, desired in modifies:
+            sz = round(desired.size, self._sz_decimals)
+            if sz <= 0:
+                continue
+            rounded.append((oid, desired, sz))
+            order = template.copy()
+            order["is_buy"] = desired.is_buy
+            order["sz"] = sz
+            order["limit_px"] = desired.price
+            reqs.append({"oid": oid, "order": order})
+        return rounded, reqs
+
+    def _build_places(
+        self,
+        places: list[DesiredOrder],
+    ) -> tuple[list[tuple[DesiredOrder, float]], list[dict[str, Any]]]:
+        template = self._order_template
+        rounded: list[tuple[DesiredOrder, float]] = []
+        reqs: list[dict[str, Any]] = []
+        for d in places:
+            sz = round(d.size, self._sz_decimals)
+            if sz <= 0:
+                continue
+            rounded.append((d, sz))
+            req = template.copy()
+            req["is_buy"] = d.is_buy
+            req["sz"] = sz
+            req["limit_px"] = d.price
+            reqs.append(req)
+        return rounded, reqs
+
+    # -- Response handlers -----------------------------------------------------
 
+    def _handle_cancels(self, cancel_oids: list[int], response: Any) -> tuple[int, int]:
         statuses = _parse_statuses(response, expected=len(cancel_oids))
         n_ok = n_err = 0
 
@@ -234,51 +366,11 @@ class BatchEmitter:
 
         return n_ok, n_err
 
-    async def _execute_modifies(
+    def _handle_modifies(
         self,
-        modifies: list[tuple[int, DesiredOrder]],
-        budget: RateLimitBudget,
+        rounded: list[tuple[int, DesiredOrder, float]],
+        response: Any,
     ) -> tuple[int, int]:
-        # Cross-side assertion
-        for oid, desired in modifies:
-            tracked = self._order_state.orders_by_oid.get(oid)
-            assert tracked is None or tracked.side == desired.side, (
-                f"Cross-side modify: oid={oid} tracked_side="
-                f"{tracked.side if tracked else None} desired_side={desired.side}"
-            )
-
-        rounded: list[tuple[int, DesiredOrder, float]] = []
-        for oid, desired in modifies:
-            sz = round(desired.size, self._sz_decimals)
-            if sz <= 0:
-                continue
-            rounded.append((oid, desired, sz))
-
-        if not rounded:
-            return 0, 0
-
-        reqs = [
-            {
-                "oid": oid,
-                "order": {
-                    "coin": self.coin,
-                    "is_buy": desired.side == "buy",
-                    "sz": sz,
-                    "limit_px": desired.price,
-                    "order_type": _ALO_ORDER_TYPE,
-                    "reduce_only": False,
-                },
-            }
-            for oid, desired, sz in rounded
-        ]
-
-        try:
-            response = await asyncio.to_thread(
-                self._exchange.bulk_modify_orders_new, reqs
-            )
-        finally:
-            budget.on_request()
-
         statuses = _parse_statuses(response, expected=len(rounded))
         n_ok = n_err = 0
 
@@ -320,38 +412,11 @@ class BatchEmitter:
 
         return n_ok, n_err
 
-    async def _execute_places(
+    def _handle_places(
         self,
-        places: list[DesiredOrder],
-        budget: RateLimitBudget,
+        rounded: list[tuple[DesiredOrder, float]],
+        response: Any,
     ) -> tuple[int, int]:
-        rounded: list[tuple[DesiredOrder, float]] = []
-        for d in places:
-            sz = round(d.size, self._sz_decimals)
-            if sz <= 0:
-                continue
-            rounded.append((d, sz))
-
-        if not rounded:
-            return 0, 0
-
-        reqs = [
-            {
-                "coin": self.coin,
-                "is_buy": d.side == "buy",
-                "sz": sz,
-                "limit_px": d.price,
-                "order_type": _ALO_ORDER_TYPE,
-                "reduce_only": False,
-            }
-            for d, sz in rounded
-        ]
-
-        try:
-            response = await asyncio.to_thread(self._exchange.bulk_orders, reqs)
-        finally:
-            budget.on_request()
-
         statuses = _parse_statuses(response, expected=len(rounded))
         n_ok = n_err = 0
 
@@ -367,22 +432,22 @@ class BatchEmitter:
                     price=desired.price,
                     size=desired.size,
                 )
-                self._clear_cooldown(desired.side)
-                self._consecutive_rejects[desired.side] = 0
+                self._clear_cooldown(desired.is_buy)
+                self._consecutive_rejects[desired.is_buy] = 0
                 n_ok += 1
             elif "error" in status:
                 error_msg = status["error"]
 
                 if "Insufficient spot balance" in error_msg:
-                    self._set_cooldown(desired.side, BALANCE_COOLDOWN_S)
+                    self._set_cooldown(desired.is_buy, BALANCE_COOLDOWN_S)
                 elif _is_alo_rejection(error_msg):
                     pass  # Expected — no cooldown, no reject counter increment.
                 else:
-                    count = self._consecutive_rejects.get(desired.side, 0) + 1
-                    self._consecutive_rejects[desired.side] = count
+                    count = self._consecutive_rejects[desired.is_buy] + 1
+                    self._consecutive_rejects[desired.is_buy] = count
                     if count >= CONSECUTIVE_REJECT_THRESHOLD:
-                        self._set_cooldown(desired.side, REJECT_COOLDOWN_S)
-                        self._consecutive_rejects[desired.side] = 0
+                        self._set_cooldown(desired.is_buy, REJECT_COOLDOWN_S)
+                        self._consecutive_rejects[desired.is_buy] = 0
                 n_err += 1
             else:
                 logger.warning(
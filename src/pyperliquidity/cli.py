@@ -4,11 +4,15 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import copy
+import functools
 import logging
 import os
 import sys
 import tomllib
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 from typing import Any
 
 import requests
@@ -17,17 +21,30 @@ logger = logging.getLogger(__name__)
 
 
 def _load_config(path: str) -> dict[str, Any]:
-    """Read and parse a TOML config file."""
+    """Read and parse a TOML config file.
+
+    Parses are cached by ``(path, mtime_ns)``, so re-reading an unchanged
+    file skips the TOML parse.  Callers get a deep copy because
+    ``_validate_config`` fills in defaults in place.
+    """
     p = Path(path)
-    if not p.exists():
+    try:
+        mtime_ns = p.stat().st_mtime_ns
+    except FileNotFoundError:
         sys.exit(f"Config file not found: {path}")
     try:
-        with p.open("rb") as f:
-            return tomllib.load(f)
+        return copy.deepcopy(_load_config_cached(str(p), mtime_ns))
     except tomllib.TOMLDecodeError as exc:
         sys.exit(f"Failed to parse config file: {exc}")
 
 
+@functools.cache
+def _load_config_cached(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse *path*; *mtime_ns* only keys the cache."""
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
 def _load_env() -> tuple[str, str]:
     """Read private key and wallet address from environment variables."""
     private_key = os.environ.get("PYPERLIQUIDITY_PRIVATE_KEY", "").strip()
@@ -39,6 +56,18 @@ def _load_env() -> tuple[str, str]:
     return private_key, wallet
 
 
+# Defaults for the optional ``[tuning]`` section.  Read-only, since every
+# validated config gets its own dict built from it.
+_TUNING_DEFAULTS: Mapping[str, float | int] = MappingProxyType({
+    "interval_s": 3.0,
+    "dead_zone_bps": 5.0,
+    "price_tolerance_bps": 1.0,
+    "size_tolerance_pct": 1.0,
+    "reconcile_every": 20,
+    "min_notional": 0.0,
+})
+
+
 def _validate_config(config: dict[str, Any]) -> dict[str, Any]:
     """Validate required fields and apply defaults for optional tuning params.
 
@@ -121,19 +150,39 @@ def _validate_config(config: dict[str, Any]) -> dict[str, Any]:
     if errors:
         sys.exit("Config validation failed:\n  " + "\n  ".join(errors))
 
-    # Apply defaults for optional tuning params
+    # Apply defaults for optional tuning params (unknown keys are dropped)
     tuning = config.get("tuning", {})
     config["tuning"] = {
-        "interval_s": tuning.get("interval_s", 3.0),
-        "dead_zone_bps": tuning.get("dead_zone_bps", 5.0),
-        "price_tolerance_bps": tuning.get("price_tolerance_bps", 1.0),
-        "size_tolerance_pct": tuning.get("size_tolerance_pct", 1.0),
-        "reconcile_every": tuning.get("reconcile_every", 20),
-        "min_notional": tuning.get("min_notional", 0.0),
+        key: tuning.get(key, default) for key, default in _TUNING_DEFAULTS.items()
     }
     return config
 
 
+_sdk: SimpleNamespace | None = None
+
+
+def _load_sdk() -> SimpleNamespace:
+    """Import the SDK modules once and keep them for later calls.
+
+    Modules rather than classes are kept, so attribute lookups (and test
+    patches on them) still resolve at call time.
+    """
+    global _sdk
+    if _sdk is None:
+        import eth_account
+        import hyperliquid.exchange  # type: ignore[import-untyped]
+        import hyperliquid.info  # type: ignore[import-untyped]
+        import hyperliquid.utils.constants  # type: ignore[import-untyped]
+
+        _sdk = SimpleNamespace(
+            eth_account=eth_account,
+            exchange=hyperliquid.exchange,
+            info=hyperliquid.info,
+            constants=hyperliquid.utils.constants,
+        )
+    return _sdk
+
+
 def _build_ws_state(
     config: dict[str, Any],
     private_key: str,
@@ -141,26 +190,19 @@ def _build_ws_state(
     cancel_on_shutdown: bool = True,
 ) -> Any:
     """Construct SDK objects and WsState."""
-    from eth_account import Account
-    from hyperliquid.exchange import Exchange  # type: ignore[import-untyped]
-    from hyperliquid.info import Info  # type: ignore[import-untyped]
-    from hyperliquid.utils.constants import (  # type: ignore[import-untyped]
-        MAINNET_API_URL,
-        TESTNET_API_URL,
-    )
-
     from pyperliquidity.spot_meta_fix import fetch_fixed_spot_meta
     from pyperliquidity.ws_state import WsState
 
+    sdk = _load_sdk()
     testnet = config.get("market", {}).get("testnet", False)
-    base_url = TESTNET_API_URL if testnet else MAINNET_API_URL
+    base_url = sdk.constants.TESTNET_API_URL if testnet else sdk.constants.MAINNET_API_URL
 
     # Fetch and fix spot_meta before constructing Info to avoid IndexError
     # when token index values diverge from array positions.
     fixed_spot_meta = fetch_fixed_spot_meta(base_url)
-    info = Info(base_url=base_url, skip_ws=False, spot_meta=fixed_spot_meta)
-    account = Account.from_key(private_key)
-    exchange = Exchange(account, base_url=base_url, spot_meta=fixed_spot_meta)
+    info = sdk.info.Info(base_url=base_url, skip_ws=False, spot_meta=fixed_spot_meta)
+    account = sdk.eth_account.Account.from_key(private_key)
+    exchange = sdk.exchange.Exchange(account, base_url=base_url, spot_meta=fixed_spot_meta)
 
     strategy = config["strategy"]
     tuning = config["tuning"]
@@ -184,6 +226,7 @@ def _build_ws_state(
         allocated_usdc=allocation["allocated_usdc"],
         active_levels=strategy.get("active_levels"),
         cancel_on_shutdown=cancel_on_shutdown,
+        spot_meta=fixed_spot_meta,
     )
 
 
@@ -9,7 +9,7 @@ import math
 from dataclasses import dataclass
 from typing import Any
 
-from pyperliquidity.pricing_grid import PricingGrid, compute_allocation_from_target_px
+from pyperliquidity.pricing_grid import cached_grid, compute_allocation_from_target_px
 
 
 @dataclass(frozen=True, slots=True)
@@ -62,7 +62,7 @@ def compute_order_sz(
     if n_orders <= 0:
         raise ValueError(f"n_orders must be positive (got {n_orders})")
 
-    grid = PricingGrid(start_px=start_px, n_orders=n_orders, tick_size=tick_size)
+    grid = cached_grid(start_px=start_px, n_orders=n_orders, tick_size=tick_size)
     cursor_level = grid.level_for_price(target_px)
     if cursor_level is None:
         raise ValueError(
@@ -133,7 +133,7 @@ def generate_grid_config(
     start_px = min_px
 
     # 2. Build grid to validate non-degenerate
-    grid = PricingGrid(start_px=start_px, n_orders=n_orders, tick_size=tick_size)
+    grid = cached_grid(start_px=start_px, n_orders=n_orders, tick_size=tick_size)
 
     # 3. Default target_px to geometric midpoint, snap to nearest grid level
     if target_px is None:
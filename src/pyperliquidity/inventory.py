@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 
 
@@ -60,8 +61,13 @@ class Inventory:
         Virtual tracks the isolated inventory; account is a hard safety cap
         to prevent placing orders that exceed actual exchange holdings.
         """
-        self.effective_token = min(self.virtual_token, self.account_token)
-        self.effective_usdc = min(self.virtual_usdc, self.account_usdc)
+        # Inline form of min(virtual, account), which runs after every fill
+        # and balance update.  Same result as the builtin: virtual unless
+        # account is strictly smaller.
+        vt, at = self.virtual_token, self.account_token
+        self.effective_token = at if at < vt else vt
+        vu, au = self.virtual_usdc, self.account_usdc
+        self.effective_usdc = au if au < vu else vu
 
     # -- Allocation management ------------------------------------------------
 
@@ -89,12 +95,7 @@ class Inventory:
         Adjusts virtual balances (the isolated inventory).  Account balances
         are updated separately via ``on_balance_update``.
         """
-        self.virtual_token -= sz
-        if fee_token == "USDC":
-            self.virtual_usdc += px * sz - fee
-        else:
-            self.virtual_usdc += px * sz
-            self.virtual_token -= fee
+        self._apply_ask(px, sz, fee, fee_token)
         self._recompute_effective()
 
     def on_bid_fill(
@@ -105,13 +106,38 @@ class Inventory:
         Adjusts virtual balances (the isolated inventory).  Account balances
         are updated separately via ``on_balance_update``.
         """
+        self._apply_bid(px, sz, fee, fee_token)
+        self._recompute_effective()
+
+    def on_fills(self, fills: Iterable[tuple[str, float, float, float, str]]) -> None:
+        """Process a burst of ``(side, px, sz, fee, fee_token)`` fills.
+
+        Each fill moves the virtual balances exactly as the single-fill
+        handlers would, in order; effective balances are recomputed once at
+        the end instead of after every fill.
+        """
+        for side, px, sz, fee, fee_token in fills:
+            if side == "sell":
+                self._apply_ask(px, sz, fee, fee_token)
+            else:
+                self._apply_bid(px, sz, fee, fee_token)
+        self._recompute_effective()
+
+    def _apply_ask(self, px: float, sz: float, fee: float, fee_token: str) -> None:
+        self.virtual_token -= sz
+        if fee_token == "USDC":
+            self.virtual_usdc += px * sz - fee
+        else:
+            self.virtual_usdc += px * sz
+            self.virtual_token -= fee
+
+    def _apply_bid(self, px: float, sz: float, fee: float, fee_token: str) -> None:
         self.virtual_usdc -= px * sz
         if fee_token == "USDC":
             self.virtual_usdc -= fee
             self.virtual_token += sz
         else:
             self.virtual_token += sz - fee
-        self._recompute_effective()
 
     def on_balance_update(self, token: float, usdc: float) -> None:
         """Update account-wide balances (hard safety cap).
@@ -6,42 +6,52 @@ mutations (modify, place, cancel) to converge current orders to desired.
 
 from __future__ import annotations
 
-from collections.abc import Sequence
-from dataclasses import dataclass, field
+from collections.abc import Collection, Sequence
+from operator import attrgetter, mul
+from typing import NamedTuple
 
 from pyperliquidity.order_state import TrackedOrder
 from pyperliquidity.quoting_engine import DesiredOrder
 
 
-@dataclass(frozen=True, slots=True)
-class OrderDiff:
-    """Minimum mutations to converge current orders to desired orders."""
+class OrderDiff(NamedTuple):
+    """Minimum mutations to converge current orders to desired orders.
 
-    modifies: list[tuple[int, DesiredOrder]] = field(default_factory=list)
-    places: list[DesiredOrder] = field(default_factory=list)
-    cancels: list[int] = field(default_factory=list)
+    A NamedTuple rather than a dataclass: one is built every tick, and tuple
+    construction is cheaper.  Omitted fields default to empty tuples, so a
+    default-constructed diff shares no mutable state with any other.
+    """
+
+    modifies: Sequence[tuple[int, DesiredOrder]] = ()
+    places: Sequence[DesiredOrder] = ()
+    cancels: Sequence[int] = ()
 
 
 _EMPTY = OrderDiff()
 
 
+_price = attrgetter("price")
+_size = attrgetter("size")
+
+
 def _weighted_mid_price(
-    prices: Sequence[float], sizes: Sequence[float]
+    orders: Collection[DesiredOrder] | Collection[TrackedOrder],
 ) -> float:
-    """Size-weighted average price. Returns 0.0 if total size is zero."""
-    total_size = 0.0
-    weighted_sum = 0.0
-    for px, sz in zip(prices, sizes):
-        weighted_sum += px * sz
-        total_size += sz
+    """Size-weighted average price. Returns 0.0 if total size is zero.
+
+    Reads ``price``/``size`` straight off the orders, so no intermediate
+    price or size lists are built on the steady-state (dead-zone) path.
+    """
+    # sum(map(...)) keeps both reductions in C; summation order is unchanged.
+    total_size = sum(map(_size, orders), 0.0)
     if total_size == 0.0:
         return 0.0
-    return weighted_sum / total_size
+    return sum(map(mul, map(_price, orders), map(_size, orders)), 0.0) / total_size
 
 
 def compute_diff(
     desired: list[DesiredOrder],
-    current: list[TrackedOrder],
+    current: Collection[TrackedOrder],
     dead_zone_bps: float,
     price_tolerance_bps: float,
     size_tolerance_pct: float,
@@ -66,70 +76,79 @@ def compute_diff(
     desired_by_key: dict[tuple[str, int], DesiredOrder] = {
         (d.side, d.level_index): d for d in desired
     }
-    current_by_key: dict[tuple[str, int], TrackedOrder] = {
-        (c.side, c.level_index): c for c in current
-    }
+    # One sweep over *current* buckets its orders by level, then side.
+    # Matching pops from the buckets, so whatever is left at the end is
+    # unmatched, and an order cancelled cross-side can never also be modified.
+    buckets: dict[int, dict[str, TrackedOrder]] = {}
+    current_keys: set[tuple[str, int]] = set()
+    stale: list[int] = []  # earlier duplicates of a (side, level_index) key
+    for t in current:
+        slots = buckets.setdefault(t.level_index, {})
+        prev = slots.get(t.side)
+        if prev is not None:
+            stale.append(prev.oid)
+        slots[t.side] = t
+        current_keys.add((t.side, t.level_index))
 
     # --- Step 2: Dead-zone check (bypassed on structural changes) ---
     # Structural changes (new levels, removed levels, side flips) always
     # propagate — the dead zone only suppresses price/size drift when
     # the same set of (side, level_index) keys is present on both sides.
-    if desired_by_key.keys() == current_by_key.keys():
-        desired_mid = _weighted_mid_price(
-            [d.price for d in desired], [d.size for d in desired]
-        )
-        current_mid = _weighted_mid_price(
-            [c.price for c in current], [c.size for c in current]
-        )
+    if desired_by_key.keys() == current_keys:
+        desired_mid = _weighted_mid_price(desired)
+        current_mid = _weighted_mid_price(current)
         if current_mid > 0.0:
-            drift_bps = abs(desired_mid - current_mid) / current_mid * 10_000
-            if drift_bps < dead_zone_bps:
+            drift = desired_mid - current_mid
+            dead_zone = current_mid * (dead_zone_bps / 10_000)
+            if -dead_zone < drift < dead_zone:
                 return _EMPTY
 
+    # Plain appends: on 3.11 the specialized list.append beats both a bound
+    # ``append`` local and preallocated lists with index counters.
     modifies: list[tuple[int, DesiredOrder]] = []
     places: list[DesiredOrder] = []
     cancels: list[int] = []
 
-    matched_current_keys: set[tuple[str, int]] = set()
-
-    for key, d in desired_by_key.items():
-        side, level_idx = key
-        if key in current_by_key:
-            # --- Same-side match ---
-            c = current_by_key[key]
-            matched_current_keys.add(key)
-
-            # Step 3: Per-order tolerance filter
-            if c.price > 0.0:
-                px_diff_bps = abs(d.price - c.price) / c.price * 10_000
-            else:
-                px_diff_bps = float("inf")
+    # Tolerances as ratios, so the per-order check multiplies instead of
+    # dividing by each current price/size.
+    px_tol = price_tolerance_bps / 10_000
+    sz_tol = size_tolerance_pct / 100
 
-            if c.size > 0.0:
-                sz_diff_pct = abs(d.size - c.size) / c.size * 100
-            else:
-                sz_diff_pct = float("inf")
+    for (side, level_idx), d in desired_by_key.items():
+        bucket = buckets.get(level_idx)
+        if not bucket:
+            # No match at all — new placement
+            places.append(d)
+            continue
 
-            if px_diff_bps <= price_tolerance_bps and sz_diff_pct <= size_tolerance_pct:
+        c = bucket.pop(side, None)
+        if c is not None:
+            # --- Same-side match ---
+            # Step 3: Per-order tolerance filter (a non-positive current
+            # price or size is never within tolerance)
+            dp = d.price - c.price
+            ds = d.size - c.size
+            px_lim = c.price * px_tol
+            sz_lim = c.size * sz_tol
+            if (
+                c.price > 0.0 and -px_lim <= dp <= px_lim
+                and c.size > 0.0 and -sz_lim <= ds <= sz_lim
+            ):
                 continue  # Within tolerance — skip
 
             modifies.append((c.oid, d))
         else:
             # --- Step 4: Cross-side check ---
-            # Is there a current order at the same level_index on the opposite side?
-            opposite_key = ("sell" if side == "buy" else "buy", level_idx)
-            if opposite_key in current_by_key and opposite_key not in matched_current_keys:
-                c = current_by_key[opposite_key]
-                matched_current_keys.add(opposite_key)
+            # The order left at this level sits on the opposite side.
+            c = bucket.pop("sell" if side == "buy" else "buy", None)
+            if c is not None:
                 cancels.append(c.oid)
-                places.append(d)
-            else:
-                # No match at all — new placement
-                places.append(d)
+            places.append(d)
 
     # Unmatched current orders → cancels
-    for key, c in current_by_key.items():
-        if key not in matched_current_keys:
-            cancels.append(c.oid)
+    cancels.extend(stale)
+    cancels.extend(t.oid for slots in buckets.values() for t in slots.values())
 
+    if not (modifies or places or cancels):
+        return _EMPTY
     return OrderDiff(modifies=modifies, places=places, cancels=cancels)
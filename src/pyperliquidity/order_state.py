@@ -7,18 +7,28 @@ differ compares against.  No I/O — receives events, doesn't fetch them.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from enum import Enum
-from typing import Literal
+from collections import deque
+from collections.abc import Iterable, ValuesView
+from dataclasses import dataclass, field
+from typing import Final, Literal, NamedTuple
 
 
-class OrderStatus(Enum):
-    """Lifecycle status of a tracked order."""
+class OrderStatus:
+    """Lifecycle status of a tracked order.
+
+    Plain int bit flags rather than an ``Enum``: reconcile tests every order
+    against the pending set, and an int AND is far cheaper than enum hashing.
+    """
+
+    RESTING: Final = 0
+    PENDING_PLACE: Final = 1
+    PENDING_MODIFY: Final = 2
+    PENDING_CANCEL: Final = 4
 
-    RESTING = "resting"
-    PENDING_PLACE = "pending_place"
-    PENDING_MODIFY = "pending_modify"
-    PENDING_CANCEL = "pending_cancel"
+
+# Statuses whose exchange-side OID may be in flux.  PENDING_PLACE is not
+# part of it: a place has no tracked OID until it is confirmed.
+_PENDING_MASK: Final = OrderStatus.PENDING_MODIFY | OrderStatus.PENDING_CANCEL
 
 
 @dataclass(slots=True)
@@ -30,12 +40,21 @@ class TrackedOrder:
     level_index: int
     price: float
     size: float
-    status: OrderStatus = OrderStatus.RESTING
+    status: int = OrderStatus.RESTING
+    # ``(side, level_index)`` index key, built once so removals don't
+    # allocate a fresh tuple per event.  Side and level never change.
+    key: tuple[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.key = (self.side, self.level_index)
 
 
-@dataclass(frozen=True, slots=True)
-class FillResult:
-    """Returned by on_fill so the caller can update inventory."""
+class FillResult(NamedTuple):
+    """Returned by on_fill so the caller can update inventory.
+
+    A ``NamedTuple``, so it compares equal to the plain tuple of its fields
+    and supports unpacking.
+    """
 
     side: Literal["buy", "sell"]
     level_index: int
@@ -44,14 +63,20 @@ class FillResult:
     fully_filled: bool
 
 
-@dataclass(frozen=True, slots=True)
-class ReconcileResult:
-    """Result of reconciling tracked state against exchange state."""
+class ReconcileResult(NamedTuple):
+    """Result of reconciling tracked state against exchange state.
+
+    A ``NamedTuple``, so it compares equal to ``(orphaned, ghosts)`` and
+    unpacks as such. Both sets are frozen, because a result may be cached
+    and returned again (or shared across instances, when empty).
+    """
 
     orphaned_oids: frozenset[int]
     ghost_oids: frozenset[int]
 
 
+_EMPTY_RECONCILE = ReconcileResult(orphaned_oids=frozenset(), ghost_oids=frozenset())
+
 # Upper bound for the seen_tids dedup set.
 _SEEN_TIDS_CAP = 5000
 
@@ -66,13 +91,27 @@ class OrderState:
     ----------
     seen_tids_cap : int
         Maximum number of trade IDs retained for dedup (default 5000).
+        Values below 1 are treated as 1, so the newest tid is always kept.
     """
 
     def __init__(self, seen_tids_cap: int = _SEEN_TIDS_CAP) -> None:
         self.orders_by_oid: dict[int, TrackedOrder] = {}
+        # Point lookups only: nothing scans orders by level in order, so no
+        # sorted per-side index is maintained alongside.
         self.orders_by_key: dict[tuple[str, int], TrackedOrder] = {}
         self._seen_tids: set[int] = set()
+        # Arrival order of the tids in ``_seen_tids``; the oldest is evicted
+        # from both once the cap is reached.
+        # The eviction check reads the oldest entry, so the window holds at
+        # least one tid.
+        seen_tids_cap = max(seen_tids_cap, 1)
+        self._tid_order: deque[int] = deque(maxlen=seen_tids_cap)
         self._seen_tids_cap = seen_tids_cap
+        # Monotonic counter bumped by every mutation of the tracked orders.
+        # Equal versions mean an unchanged book, which lets reconcile and the
+        # tick loop reuse their last results.
+        self.version = 0
+        self._last_reconcile: tuple[int, frozenset[int], ReconcileResult] | None = None
 
     # -- Place confirmation ---------------------------------------------------
 
@@ -89,13 +128,10 @@ class OrderState:
         If an order already exists at the same (side, level_index), the old
         order is evicted from both indices before inserting the new one.
         """
-        key = (side, level_index)
-
-        # Evict any existing order at this grid level.
-        existing = self.orders_by_key.get(key)
-        if existing is not None:
-            self.orders_by_oid.pop(existing.oid, None)
-
+        # Canonicalize to the compiler-interned literal, so index keys compare
+        # by identity even when a caller built the string at runtime.
+        side = "buy" if side == "buy" else "sell"
+        self.version += 1
         order = TrackedOrder(
             oid=oid,
             side=side,
@@ -104,6 +140,13 @@ class OrderState:
             size=size,
             status=OrderStatus.RESTING,
         )
+        key = order.key
+
+        # Evict any existing order at this grid level.
+        existing = self.orders_by_key.get(key)
+        if existing is not None:
+            self.orders_by_oid.pop(existing.oid, None)
+
         self.orders_by_oid[oid] = order
         self.orders_by_key[key] = order
 
@@ -113,12 +156,14 @@ class OrderState:
         """Mark an order as pending modify.  Called before sending the request."""
         order = self.orders_by_oid.get(oid)
         if order is not None:
+            self.version += 1
             order.status = OrderStatus.PENDING_MODIFY
 
     def mark_pending_cancel(self, oid: int) -> None:
         """Mark an order as pending cancel.  Called before sending the request."""
         order = self.orders_by_oid.get(oid)
         if order is not None:
+            self.version += 1
             order.status = OrderStatus.PENDING_CANCEL
 
     # -- Modify response ------------------------------------------------------
@@ -136,13 +181,17 @@ class OrderState:
         - Unknown original_oid → no-op (idempotent).
         """
         order = self.orders_by_oid.get(original_oid)
+        if order is not None:
+            self.version += 1
 
-        if "Cannot modify" in status:
+        # Successful acks pass the "resting" literal, which matches by
+        # identity; only error strings pay for the substring search.  The
+        # error text varies ("error: Cannot modify ..."), so no exact match.
+        if status != "resting" and "Cannot modify" in status:
             # Ghost — already filled on exchange.  Remove from both indices.
             if order is not None:
                 self.orders_by_oid.pop(original_oid, None)
-                key = (order.side, order.level_index)
-                self.orders_by_key.pop(key, None)
+                self.orders_by_key.pop(order.key, None)
             return
 
         if order is None:
@@ -173,9 +222,10 @@ class OrderState:
         if tid in self._seen_tids:
             return None
 
+        if len(self._tid_order) == self._seen_tids_cap:
+            self._seen_tids.discard(self._tid_order[0])
+        self._tid_order.append(tid)
         self._seen_tids.add(tid)
-        if len(self._seen_tids) > self._seen_tids_cap:
-            self._prune_seen_tids()
 
         order = self.orders_by_oid.get(oid)
         if order is None:
@@ -193,20 +243,15 @@ class OrderState:
         )
 
         if fully_filled:
+            self.version += 1
             self.orders_by_oid.pop(oid, None)
-            key = (order.side, order.level_index)
-            self.orders_by_key.pop(key, None)
+            self.orders_by_key.pop(order.key, None)
         else:
+            self.version += 1
             order.size = remaining
 
         return result
 
-    def _prune_seen_tids(self) -> None:
-        """Keep the newest half of seen tids (tids are monotonically increasing)."""
-        sorted_tids = sorted(self._seen_tids)
-        half = len(sorted_tids) // 2
-        self._seen_tids = set(sorted_tids[half:])
-
     # -- Reconciliation -------------------------------------------------------
 
     def reconcile(self, exchange_oids: set[int]) -> ReconcileResult:
@@ -218,30 +263,73 @@ class OrderState:
         Orders in pending states (PENDING_MODIFY, PENDING_CANCEL) are excluded
         from ghost detection because their OIDs may be in flux (e.g., an OID
         swap from a modify that hasn't been processed yet).
+
+        When no mutator has run since the previous call and *exchange_oids*
+        is unchanged, the previous result is returned as-is.
         """
-        pending_statuses = {OrderStatus.PENDING_MODIFY, OrderStatus.PENDING_CANCEL}
-        tracked_oids = set(self.orders_by_oid.keys())
-        pending_oids = {
-            oid for oid, order in self.orders_by_oid.items()
-            if order.status in pending_statuses
-        }
+        last = self._last_reconcile
+        if (
+            last is not None
+            and last[0] == self.version
+            and last[1] == exchange_oids
+        ):
+            return last[2]
+
+        orders_by_oid = self.orders_by_oid
+        if exchange_oids == orders_by_oid.keys():
+            # In sync (the common quiet case): nothing is orphaned or a ghost,
+            # and the shared empty result needs no allocation at all.
+            return _EMPTY_RECONCILE
+
         # Pending orders are excluded from ghost detection — their exchange-side
-        # OID may differ from what we're tracking.
-        eligible_for_ghost = tracked_oids - pending_oids
-        return ReconcileResult(
-            orphaned_oids=frozenset(exchange_oids - tracked_oids),
-            ghost_oids=frozenset(eligible_for_ghost - exchange_oids),
+        # OID may differ from what we're tracking.  One pass finds the ghosts
+        # directly, without materializing the tracked or pending OID sets.
+        exchange = frozenset(exchange_oids)
+        ghosts = frozenset(
+            oid for oid, order in orders_by_oid.items()
+            if not order.status & _PENDING_MASK and oid not in exchange
+        )
+        result = ReconcileResult(
+            orphaned_oids=exchange.difference(orders_by_oid),
+            ghost_oids=ghosts,
         )
+        self._last_reconcile = (self.version, exchange, result)
+        return result
 
     def remove_ghost(self, oid: int) -> None:
         """Remove a ghost order from both indices.  Idempotent."""
         order = self.orders_by_oid.pop(oid, None)
         if order is not None:
-            key = (order.side, order.level_index)
-            self.orders_by_key.pop(key, None)
+            self.version += 1
+            self.orders_by_key.pop(order.key, None)
+
+    def remove_ghosts(self, oids: Iterable[int]) -> None:
+        """Remove several ghost orders at once.  Idempotent per oid.
+
+        Equivalent to :meth:`remove_ghost` for each oid, but bumps
+        :attr:`version` once for the whole batch.
+        """
+        orders_by_oid = self.orders_by_oid
+        orders_by_key = self.orders_by_key
+        removed = False
+        for oid in oids:
+            order = orders_by_oid.pop(oid, None)
+            if order is not None:
+                removed = True
+                orders_by_key.pop(order.key, None)
+        if removed:
+            self.version += 1
 
     # -- Queries --------------------------------------------------------------
 
     def get_current_orders(self) -> list[TrackedOrder]:
         """Return a snapshot of all currently tracked orders."""
         return list(self.orders_by_oid.values())
+
+    def iter_current_orders(self) -> ValuesView[TrackedOrder]:
+        """Return a live view of all currently tracked orders.
+
+        No copy is made, so the view reflects later mutations; use
+        :meth:`get_current_orders` when a stable snapshot is needed.
+        """
+        return self.orders_by_oid.values()
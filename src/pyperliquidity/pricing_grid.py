@@ -6,6 +6,7 @@ import math
 from bisect import bisect_left
 from collections.abc import Callable
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 
 def _default_round(px: float) -> float:
@@ -36,21 +37,41 @@ class PricingGrid:
     n_orders: int
     tick_size: float = 0.003
     round_fn: Callable[[float], float] = _default_round
+    # A tuple rather than a list: bisect runs within noise on either, and
+    # ``levels`` can hand the ladder out without a defensive copy.
     _levels: tuple[float, ...] = field(init=False, repr=False)
+    # level_for_price acceptance bounds: half a tick beyond each end.
+    _lo_bound: float = field(init=False, repr=False)
+    _hi_bound: float = field(init=False, repr=False)
+    # Exact level price → index.  Exchange echoes of our own orders carry the
+    # grid price verbatim, so most lookups never reach the bisect.
+    _index_of: dict[float, int] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        prices: list[float] = [self.round_fn(self.start_px)]
-        for _ in range(self.n_orders - 1):
-            next_px = self.round_fn(prices[-1] * (1 + self.tick_size))
-            if next_px == prices[-1]:
+        # Each level is rounded from the previous *rounded* level (the HIP-2
+        # recurrence), so a closed-form start_px * (1 + tick)**i would drift
+        # from the on-chain ladder.  The loop stays; only lookups are hoisted.
+        round_fn = self.round_fn
+        factor = 1 + self.tick_size
+        prev = round_fn(self.start_px)
+        prices: list[float] = [prev]
+        append = prices.append
+        for i in range(1, self.n_orders):
+            next_px = round_fn(prev * factor)
+            if next_px == prev:
                 raise ValueError(
-                    f"Degenerate grid: rounding collapsed level {len(prices)} "
-                    f"to same price as level {len(prices) - 1} ({next_px}). "
+                    f"Degenerate grid: rounding collapsed level {i} "
+                    f"to same price as level {i - 1} ({next_px}). "
                     f"Increase rounding precision or tick_size."
                 )
-            prices.append(next_px)
+            append(next_px)
+            prev = next_px
         # Bypass frozen restriction for init
         object.__setattr__(self, "_levels", tuple(prices))
+        lo, hi = prices[0], prices[-1]
+        object.__setattr__(self, "_lo_bound", lo - lo * self.tick_size / 2)
+        object.__setattr__(self, "_hi_bound", hi + hi * self.tick_size / 2)
+        object.__setattr__(self, "_index_of", {px: i for i, px in enumerate(prices)})
 
     @property
     def levels(self) -> tuple[float, ...]:
@@ -71,30 +92,36 @@ class PricingGrid:
     def level_for_price(self, px: float) -> int | None:
         """Nearest grid level index for *px*, or None if outside the grid range.
 
-        Uses binary search for O(log n) lookup. When *px* falls exactly between
+        Exact level prices resolve in O(1); anything else falls back to a
+        binary search, O(log n). When *px* falls exactly between
         two levels, the lower index is returned (tie-breaking rule).
 
         Returns None if *px* is below levels[0] by more than half a tick spacing
         or above levels[-1] by more than half a tick spacing.
         """
-        levels = self._levels
-        if not levels:
-            return None
+        idx = self.level_index_for(px)
+        return None if idx < 0 else idx
 
-        half_tick_low = levels[0] * self.tick_size / 2
-        half_tick_high = levels[-1] * self.tick_size / 2
+    def level_index_for(self, px: float) -> int:
+        """Like :meth:`level_for_price`, but returns -1 when *px* is off the grid.
 
-        if px < levels[0] - half_tick_low:
-            return None
-        if px > levels[-1] + half_tick_high:
-            return None
+        -1 is the level index OrderState records for off-grid orders, so
+        callers seeding it from exchange prices can pass the result through.
+        """
+        exact = self._index_of.get(px)
+        if exact is not None:
+            return exact
+        if px < self._lo_bound or px > self._hi_bound:
+            return -1
 
+        levels = self._levels
         idx = bisect_left(levels, px)
 
         if idx == 0:
             return 0
-        if idx == len(levels):
-            return len(levels) - 1
+        n = len(levels)
+        if idx == n:
+            return n - 1
 
         # Compare distance to left and right neighbors
         left = levels[idx - 1]
@@ -104,6 +131,19 @@ class PricingGrid:
         return idx
 
 
+@lru_cache(maxsize=128, typed=True)
+def cached_grid(start_px: float, n_orders: int, tick_size: float = 0.003) -> PricingGrid:
+    """Shared default-rounding grid for these parameters.
+
+    A grid is immutable, so config validation, config generation and the
+    runtime can all hold the same instance instead of re-running the
+    recurrence.  Pass arguments by keyword: the cache keys on call shape,
+    and on argument type, so an int ``start_px`` never aliases a float one.
+    Grids with a custom ``round_fn`` are constructed directly.
+    """
+    return PricingGrid(start_px=start_px, n_orders=n_orders, tick_size=tick_size)
+
+
 def compute_allocation_from_target_px(
     target_px: float,
     start_px: float,
@@ -142,7 +182,7 @@ def compute_allocation_from_target_px(
     ValueError
         If *target_px* is below *start_px* or above the grid's maximum price.
     """
-    grid = PricingGrid(start_px=start_px, n_orders=n_orders, tick_size=tick_size)
+    grid = cached_grid(start_px=start_px, n_orders=n_orders, tick_size=tick_size)
 
     if target_px < start_px:
         raise ValueError(
@@ -6,22 +6,44 @@ derived from token inventory each tick on a fixed PricingGrid.
 
 from __future__ import annotations
 
-import math
-from dataclasses import dataclass
-from typing import Literal
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from typing import Literal, NamedTuple
 
 from pyperliquidity.pricing_grid import PricingGrid
 
 
-@dataclass(frozen=True, slots=True)
-class DesiredOrder:
-    """An order the quoting engine wants on the book."""
+class DesiredOrder(NamedTuple):
+    """An order the quoting engine wants on the book.
+
+    A ``NamedTuple``: it compares equal to (and hashes like) the plain tuple
+    of its fields, and supports unpacking and iteration.
+    """
 
     side: Literal["buy", "sell"]
     level_index: int
     price: float
     size: float
 
+    @property
+    def is_buy(self) -> bool:
+        """True for bids; read by the emitter's request builders."""
+        return self.side == "buy"
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _full_order(
+    side: Literal["buy", "sell"], level_index: int, price: float, size: float,
+) -> DesiredOrder:
+    """Shared full-size order for a level.
+
+    Full-size orders repeat tick after tick while the cursor holds still, so
+    reusing the immutable instance skips most per-tick allocations.  Partial
+    orders carry a fresh size nearly every tick and are built directly.
+    """
+    return DesiredOrder(side, level_index, price, size)
+
 
 def compute_desired_orders(
     grid: PricingGrid,
@@ -67,7 +89,8 @@ def compute_desired_orders(
         return []
 
     # --- Cursor derivation ---
-    n_full_asks = math.floor(effective_token / order_sz) if effective_token > 0 else 0
+    # Truncation equals floor here: the quotient is positive whenever it is taken.
+    n_full_asks = int(effective_token / order_sz) if effective_token > 0 else 0
     partial_ask_sz = effective_token % order_sz if effective_token > 0 else 0.0
     total_ask_levels = min(
         n_full_asks + (1 if partial_ask_sz > 0 else 0),
@@ -76,58 +99,63 @@ def compute_desired_orders(
     cursor = grid.n_orders - total_ask_levels
 
     orders: list[DesiredOrder] = []
+    # Loop ranges are clamped to the grid, so index the ladder directly
+    # instead of paying price_at_level's dispatch and bounds check per level.
+    levels = grid.levels
+    new_order = DesiredOrder
+    full_order = _full_order
 
     # --- Ask placement: ascending from cursor ---
     ask_limit = active_levels if active_levels is not None else grid.n_orders
     if effective_token > 0:
+        # Clamp to the grid and the level limit up front; the partial ask at
+        # the cursor counts against the limit like any full ask.
+        ask_end = min(grid.n_orders, cursor + ask_limit)
         level = cursor
-        ask_count = 0
-        # Partial ask at cursor level (if remainder > 0)
-        if partial_ask_sz > 0 and level < grid.n_orders and ask_count < ask_limit:
-            px = grid.price_at_level(level)
+        if partial_ask_sz > 0 and level < ask_end:
+            px = levels[level]
             if min_notional <= 0 or px * partial_ask_sz >= min_notional:
-                orders.append(DesiredOrder(
+                orders.append(new_order(
                     side="sell", level_index=level, price=px, size=partial_ask_sz,
                 ))
-            ask_count += 1
             level += 1
 
         # Full asks ascending
-        asks_placed = 0
-        while asks_placed < n_full_asks and level < grid.n_orders and ask_count < ask_limit:
-            px = grid.price_at_level(level)
-            if min_notional <= 0 or px * order_sz >= min_notional:
-                orders.append(DesiredOrder(
-                    side="sell", level_index=level, price=px, size=order_sz,
-                ))
-            asks_placed += 1
-            ask_count += 1
-            level += 1
+        full_end = min(level + n_full_asks, ask_end)
+        orders.extend([
+            full_order("sell", lvl, px, order_sz)
+            for lvl, px in zip(range(level, full_end), levels[level:full_end])
+            if min_notional <= 0 or px * order_sz >= min_notional
+        ])
 
     # --- Bid placement: descending from cursor-1 ---
+    # Running totals of the per-level cost turn "how many full bids does the
+    # USDC cover" into one bisect instead of a subtract-and-compare walk.
+    # They are summed from the cursor down on purpose: a memoized ascending
+    # prefix table would answer by subtraction, and that can round an exact
+    # fit to the other side of the bisect.
     bid_limit = active_levels if active_levels is not None else grid.n_orders
-    remaining_usdc = effective_usdc
-    bid_count = 0
-    level = cursor - 1
-    while level >= 0 and remaining_usdc > 0 and bid_count < bid_limit:
-        px = grid.price_at_level(level)
-        cost = px * order_sz
-        if remaining_usdc >= cost:
-            # Full bid
+    bid_lo = max(cursor - bid_limit, 0)
+    if effective_usdc > 0 and cursor > bid_lo:
+        bid_prices = levels[bid_lo:cursor][::-1]
+        cum_cost = list(accumulate(px * order_sz for px in bid_prices))
+        n_full_bids = bisect_right(cum_cost, effective_usdc)
+
+        level = cursor - 1
+        for px in bid_prices[:n_full_bids]:
             if min_notional <= 0 or px * order_sz >= min_notional:
-                orders.append(DesiredOrder(
-                    side="buy", level_index=level, price=px, size=order_sz,
-                ))
-            remaining_usdc -= cost
-        else:
-            # Partial bid — remaining USDC can't cover a full order
-            partial_sz = remaining_usdc / px
-            if min_notional <= 0 or px * partial_sz >= min_notional:
-                orders.append(DesiredOrder(
-                    side="buy", level_index=level, price=px, size=partial_sz,
-                ))
-            remaining_usdc = 0
-        bid_count += 1
-        level -= 1
+                orders.append(full_order("buy", level, px, order_sz))
+            level -= 1
+
+        # Partial bid — leftover USDC can't cover a full order
+        if n_full_bids < len(bid_prices):
+            leftover = effective_usdc - (cum_cost[n_full_bids - 1] if n_full_bids else 0.0)
+            if leftover > 0:
+                px = bid_prices[n_full_bids]
+                partial_sz = leftover / px
+                if min_notional <= 0 or px * partial_sz >= min_notional:
+                    orders.append(new_order(
+                        side="buy", level_index=level, price=px, size=partial_sz,
+                    ))
 
     return orders
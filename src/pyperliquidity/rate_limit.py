@@ -15,8 +15,9 @@ from dataclasses import dataclass, field
 class RateLimitBudget:
     """Tracks the Hyperliquid rate-limit budget model.
 
-    Pure state — no I/O, no async. Mutation via on_request / on_fill /
-    sync_from_exchange; queries via remaining / is_healthy / is_emergency.
+    Pure state — no I/O, no async. Mutation via on_request / try_reserve /
+    on_fill / sync_from_exchange; queries via remaining / is_healthy /
+    is_emergency / is_critical.
     """
 
     cum_vlm: float = 0.0
@@ -49,9 +50,17 @@ class RateLimitBudget:
         """True when earning volume faster than spending requests."""
         return self.ratio >= 1.0
 
+    # The threshold checks compare the raw budget directly.  For a positive
+    # integer margin, ``budget < margin`` is equivalent to
+    # ``remaining() < margin`` without the int()/max() round-trip.
+
     def is_emergency(self) -> bool:
         """True when budget is below the safety margin."""
-        return self.remaining() < self.SAFETY_MARGIN
+        return self.budget < self.SAFETY_MARGIN
+
+    def is_critical(self) -> bool:
+        """True when budget is below the critical (near-throttle) margin."""
+        return self.budget < self.CRITICAL_MARGIN
 
     # -- mutations ------------------------------------------------------------
 
@@ -59,6 +68,18 @@ class RateLimitBudget:
         """Record *n* API requests (batch ops count as 1)."""
         self.n_requests += n
 
+    def try_reserve(self, n: int = 1, min_remaining: int = 0) -> bool:
+        """Debit *n* requests if at least *min_remaining* budget is left.
+
+        Check and debit happen in one call, so nothing can spend the budget
+        between the gate and the payment.  Returns False and debits nothing
+        when ``remaining() < min_remaining``.
+        """
+        if min_remaining > 0 and self.budget < min_remaining:
+            return False
+        self.n_requests += n
+        return True
+
     def on_fill(self, volume_usd: float) -> None:
         """Record maker fill volume in USD."""
         self.cum_vlm += volume_usd
@@ -70,9 +91,17 @@ class RateLimitBudget:
 
     # -- logging --------------------------------------------------------------
 
-    def log_status(self) -> str:
-        """Formatted utilization string for periodic logging."""
+    def __str__(self) -> str:
+        """Utilization summary, built only when actually rendered.
+
+        Pass the budget itself as a ``%s`` logging argument so the formatting
+        is skipped for records that are filtered out.
+        """
         return (
             f"Utilization: ratio={self.ratio:.2f} budget={self.remaining()} "
             f"vol=${self.cum_vlm:.0f} reqs={self.n_requests}"
         )
+
+    def log_status(self) -> str:
+        """Formatted utilization string for periodic logging."""
+        return str(self)
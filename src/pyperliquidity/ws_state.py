@@ -8,22 +8,72 @@ calling into the pure-computation and I/O modules.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
-import math
 import signal
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Literal
 
-from pyperliquidity.batch_emitter import BatchEmitter
+from pyperliquidity.batch_emitter import BatchEmitter, EmitResult
 from pyperliquidity.inventory import Inventory
 from pyperliquidity.order_differ import OrderDiff, compute_diff
 from pyperliquidity.order_state import OrderState
-from pyperliquidity.pricing_grid import PricingGrid
-from pyperliquidity.quoting_engine import compute_desired_orders
+from pyperliquidity.pricing_grid import PricingGrid, cached_grid
+from pyperliquidity.quoting_engine import DesiredOrder, compute_desired_orders
 from pyperliquidity.rate_limit import RateLimitBudget
 from pyperliquidity.spot_meta_fix import fix_spot_meta
 
 logger = logging.getLogger(__name__)
 
+# Async WS message handler, as queued by the sync SDK callbacks.
+_Handler = Callable[[Any], Awaitable[None]]
+
+# Startup issues this many independent REST reads at once.
+_REST_WORKERS = 4
+
+# Result reported for a tick that had nothing to emit.
+_QUIET_EMIT = EmitResult(0, 0, 0, 0, cancel_only_mode=False)
+
+
+def _extract_balances(
+    balances: list[dict[str, Any]], token_coin: str,
+) -> tuple[float | None, float | None]:
+    """Pull ``(token, usdc)`` totals out of a spot balances list.
+
+    Single pass that stops once both coins are seen.  A coin that is absent
+    comes back as ``None`` so callers can choose their own default.
+    """
+    token_bal: float | None = None
+    usdc_bal: float | None = None
+    for bal in balances:
+        coin = bal.get("coin", "")
+        if coin == token_coin:
+            token_bal = float(bal.get("total", 0))
+        elif coin == "USDC":
+            usdc_bal = float(bal.get("total", 0))
+        else:
+            continue
+        if token_bal is not None and usdc_bal is not None:
+            break
+    return token_bal, usdc_bal
+
+
+def _next_slot(slot: int, elapsed: float, interval: float) -> int:
+    """Index of the next tick slot after *slot*, *elapsed* seconds in.
+
+    Slot ``k`` starts at ``k * interval``.  A tick that ran past the next
+    slot skips every slot already started rather than firing them back to
+    back.  Slots are counted as integers so that an on-time tick always
+    yields exactly ``slot + 1``, free of float accumulation.
+    """
+    nxt = slot + 1
+    if interval > 0 and nxt * interval <= elapsed:
+        nxt = max(nxt, int(elapsed // interval) + 1)
+        if nxt * interval <= elapsed:
+            nxt += 1
+    return nxt
+
 
 class WsState:
     """Orchestrator that wires all modules into a running market maker.
@@ -66,6 +116,10 @@ class WsState:
     cancel_on_shutdown : bool
         When ``True`` (default), cancel all resting orders on SIGINT/SIGTERM
         before exiting.  Set to ``False`` to leave orders resting.
+    spot_meta : dict | None
+        An already-fixed ``spotMeta`` payload (see
+        :func:`~pyperliquidity.spot_meta_fix.fix_spot_meta`).  When given,
+        startup reuses it instead of fetching it again.
     """
 
     def __init__(
@@ -87,6 +141,7 @@ class WsState:
         allocated_usdc: float = float("inf"),
         active_levels: int | None = None,
         cancel_on_shutdown: bool = True,
+        spot_meta: dict[str, Any] | None = None,
     ) -> None:
         self.coin = coin
         self.start_px = start_px
@@ -106,6 +161,14 @@ class WsState:
         self._info = info
         self._exchange = exchange
         self._address = address
+        # Long-lived workers for blocking SDK REST calls, so they reuse
+        # threads (and keep-alive connections) instead of the default pool.
+        # Sized for the concurrent startup reads.
+        self._rest_executor = ThreadPoolExecutor(
+            max_workers=_REST_WORKERS, thread_name_prefix="rest",
+        )
+        # Static reference data: fetched at most once per process.
+        self._spot_meta: dict[str, Any] | None = spot_meta
 
         # Modules — initialized during startup
         self.order_state: OrderState = OrderState()
@@ -120,6 +183,24 @@ class WsState:
         self._tick_count: int = 0
         self._ws_alive: bool = True
         self._shutting_down: bool = False
+        # WS messages posted from the SDK thread, drained by _drain_inbox.
+        self._inbox: asyncio.Queue[tuple[_Handler, Any]] = asyncio.Queue()
+        # Latest (token, usdc) from webData2, applied once per tick.
+        self._pending_balance: tuple[float, float] | None = None
+
+        # Last tick's desired orders and the inputs they were computed from,
+        # plus the (inputs, book version, tolerances) key of the last tick
+        # whose diff came out empty.
+        self._last_desired_key: tuple[Any, ...] | None = None
+        self._last_desired: list[DesiredOrder] = []
+        self._quiet_key: tuple[Any, ...] | None = None
+
+    # -- REST I/O --------------------------------------------------------------
+
+    def _rest(self, fn: Callable[..., Any], *args: Any) -> asyncio.Future[Any]:
+        """Run a blocking SDK call on a REST worker thread."""
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self._rest_executor, fn, *args)
 
     # -- Startup ---------------------------------------------------------------
 
@@ -127,9 +208,16 @@ class WsState:
         """Seed all modules from REST data."""
         self._loop = asyncio.get_running_loop()
 
+        # The REST reads are independent, so fetch them concurrently; the
+        # steps below still seed the modules in order from the results.
+        spot_meta, open_orders, spot_state, rate_info = await asyncio.gather(
+            self._get_spot_meta(),
+            self._rest(self._info.open_orders, self._address),
+            self._rest(self._info.spot_user_state, self._address),
+            self._rest(self._info.user_rate_limit, self._address),
+        )
+
         # 1. Resolve coin → asset_id and base token name for balance lookups
-        raw_spot_meta = await asyncio.to_thread(self._info.spot_meta)
-        spot_meta = fix_spot_meta(raw_spot_meta)
         universe = spot_meta["universe"]
         spot_entry: dict[str, Any] | None = None
         for token in universe:
@@ -146,10 +234,9 @@ class WsState:
         self._sz_decimals: int = int(base_token.get("szDecimals", 5))
 
         # 2. Construct fixed PricingGrid
-        self.grid = PricingGrid(start_px=self.start_px, n_orders=self.n_orders)
+        self.grid = cached_grid(start_px=self.start_px, n_orders=self.n_orders)
 
         # 3. Seed OrderState from open_orders
-        open_orders = await asyncio.to_thread(self._info.open_orders, self._address)
         for order in open_orders:
             if order.get("coin") != self.coin:
                 continue
@@ -157,37 +244,26 @@ class WsState:
             side: Literal["buy", "sell"] = "buy" if order["side"] == "B" else "sell"
             px = float(order["limitPx"])
             sz = float(order["sz"])
-            level_index = self.grid.level_for_price(px)
             self.order_state.on_place_confirmed(
                 oid=oid, side=side,
-                level_index=level_index if level_index is not None else -1,
+                level_index=self.grid.level_index_for(px),
                 price=px, size=sz,
             )
 
         # 4. Seed Inventory from spot_user_state
-        spot_state = await asyncio.to_thread(
-            self._info.spot_user_state, self._address,
+        token_bal, usdc_bal = _extract_balances(
+            spot_state.get("balances", []), self._balance_coin,
         )
-        token_bal = 0.0
-        usdc_bal = 0.0
-        for bal in spot_state.get("balances", []):
-            if bal["coin"] == self._balance_coin:
-                token_bal = float(bal["total"])
-            elif bal["coin"] == "USDC":
-                usdc_bal = float(bal["total"])
 
         self.inventory = Inventory(
             order_sz=self.order_sz,
             allocated_token=self._allocated_token,
             allocated_usdc=self._allocated_usdc,
-            account_token=token_bal,
-            account_usdc=usdc_bal,
+            account_token=token_bal or 0.0,
+            account_usdc=usdc_bal or 0.0,
         )
 
         # 5. Seed RateLimitBudget from user_rate_limit
-        rate_info = await asyncio.to_thread(
-            self._info.user_rate_limit, self._address,
-        )
         self.rate_limit.sync_from_exchange(
             cum_vlm=float(rate_info.get("cumVlm", 0)),
             n_requests=int(rate_info.get("nRequestsUsed", 0)),
@@ -209,6 +285,13 @@ class WsState:
             len(self.order_state.orders_by_oid),
         )
 
+    async def _get_spot_meta(self) -> dict[str, Any]:
+        """Return the fixed ``spotMeta``, fetching it only on first use."""
+        if self._spot_meta is None:
+            raw_spot_meta = await self._rest(self._info.spot_meta)
+            self._spot_meta = fix_spot_meta(raw_spot_meta)
+        return self._spot_meta
+
     # -- WebSocket subscriptions -----------------------------------------------
 
     def _subscribe(self) -> None:
@@ -229,25 +312,45 @@ class WsState:
     # -- Sync → async bridge ---------------------------------------------------
 
     def _on_order_update_sync(self, msg: Any) -> None:
-        """Sync callback from SDK WS thread → async handler."""
-        if self._loop is not None:
-            asyncio.run_coroutine_threadsafe(
-                self._handle_order_update(msg), self._loop,
-            )
+        """Sync callback from SDK WS thread → inbox."""
+        self._post(self._handle_order_update, msg)
 
     def _on_fill_sync(self, msg: Any) -> None:
-        """Sync callback from SDK WS thread → async handler."""
-        if self._loop is not None:
-            asyncio.run_coroutine_threadsafe(
-                self._handle_fill(msg), self._loop,
-            )
+        """Sync callback from SDK WS thread → inbox."""
+        self._post(self._handle_fill, msg)
 
     def _on_balance_sync(self, msg: Any) -> None:
-        """Sync callback from SDK WS thread → async handler."""
+        """Sync callback from SDK WS thread → inbox."""
+        self._post(self._handle_balance_update, msg)
+
+    def _post(self, handler: _Handler, msg: Any) -> None:
+        """Hand a WS message to the event loop's inbox.
+
+        Costs one ``call_soon_threadsafe`` per message instead of a task and
+        a concurrent Future; :meth:`_drain_inbox` dispatches whole bursts.
+        """
         if self._loop is not None:
-            asyncio.run_coroutine_threadsafe(
-                self._handle_balance_update(msg), self._loop,
-            )
+            self._loop.call_soon_threadsafe(self._inbox.put_nowait, (handler, msg))
+
+    async def _drain_inbox(self) -> None:
+        """Dispatch queued WS messages to their handlers, in arrival order.
+
+        Wakes once per burst and runs every message already queued.  The
+        handlers never yield, so each message is still applied atomically
+        with respect to the tick loop.
+        """
+        inbox = self._inbox
+        while True:
+            handler, msg = await inbox.get()
+            while True:
+                try:
+                    await handler(msg)
+                except Exception:
+                    logger.exception("WS handler %s failed", handler.__name__)
+                try:
+                    handler, msg = inbox.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
 
     # -- Async handlers --------------------------------------------------------
 
@@ -275,10 +378,9 @@ class WsState:
                 side: Literal["buy", "sell"] = "buy" if order.get("side") == "B" else "sell"
                 px = float(order.get("limitPx", 0))
                 sz = float(order.get("sz", 0))
-                level_index = self.grid.level_for_price(px) if self.grid else -1
                 self.order_state.on_place_confirmed(
                     oid=oid, side=side,
-                    level_index=level_index if level_index is not None else -1,
+                    level_index=self.grid.level_index_for(px) if self.grid else -1,
                     price=px, size=sz,
                 )
             elif "Cannot modify" in status:
@@ -307,28 +409,32 @@ class WsState:
             fills = msg
         else:
             return
-        for fill in fills:
-            tid = fill.get("tid")
-            oid = fill.get("oid")
-            sz = float(fill.get("sz", 0))
-            px = float(fill.get("px", 0))
-            fee = float(fill.get("fee", 0))
-            fee_token = fill.get("feeToken", "USDC")
-            if tid is None or oid is None:
-                continue
-
-            result = self.order_state.on_fill(tid=tid, oid=oid, fill_sz=sz)
-            if result is not None and self.inventory is not None:
-                volume_usd = px * sz
-                self.rate_limit.on_fill(volume_usd)
-                if result.side == "sell":
-                    self.inventory.on_ask_fill(
-                        px=px, sz=sz, fee=fee, fee_token=fee_token,
-                    )
-                else:
-                    self.inventory.on_bid_fill(
-                        px=px, sz=sz, fee=fee, fee_token=fee_token,
-                    )
+        # Fills accepted from this message, handed to Inventory as one burst.
+        # Flushed even if a later fill is malformed: the earlier ones are
+        # already recorded in OrderState and would otherwise never be seen
+        # again (their tids are deduped).
+        applied: list[tuple[str, float, float, float, str]] = []
+        try:
+            for fill in fills:
+                tid = fill.get("tid")
+                oid = fill.get("oid")
+                if tid is None or oid is None:
+                    continue
+
+                sz = float(fill.get("sz", 0))
+                result = self.order_state.on_fill(tid=tid, oid=oid, fill_sz=sz)
+                if result is not None and self.inventory is not None:
+                    # Parsed only for accepted fills: the snapshot userFills
+                    # sends on (re)subscribe is mostly already-seen tids.
+                    px = float(fill.get("px", 0))
+                    fee = float(fill.get("fee", 0))
+                    fee_token = fill.get("feeToken", "USDC")
+                    volume_usd = px * sz
+                    self.rate_limit.on_fill(volume_usd)
+                    applied.append((result.side, px, sz, fee, fee_token))
+        finally:
+            if applied and self.inventory is not None:
+                self.inventory.on_fills(applied)
 
     async def _handle_balance_update(self, msg: Any) -> None:
         """Route webData2 balance updates to Inventory.
@@ -347,16 +453,17 @@ class WsState:
         spot_balances = balances.get("spotBalances", balances.get("balances", []))
         if not isinstance(spot_balances, list):
             return
-        token_bal: float | None = None
-        usdc_bal: float | None = None
-        for bal in spot_balances:
-            coin = bal.get("coin", "")
-            if coin == self._balance_coin:
-                token_bal = float(bal.get("total", 0))
-            elif coin == "USDC":
-                usdc_bal = float(bal.get("total", 0))
+        token_bal, usdc_bal = _extract_balances(spot_balances, self._balance_coin)
         if token_bal is not None and usdc_bal is not None:
-            self.inventory.on_balance_update(token=token_bal, usdc=usdc_bal)
+            # Only the latest snapshot matters; _tick applies it.
+            self._pending_balance = (token_bal, usdc_bal)
+
+    def _apply_pending_balance(self) -> None:
+        """Apply the latest debounced webData2 balances to Inventory."""
+        pending = self._pending_balance
+        if pending is not None and self.inventory is not None:
+            self._pending_balance = None
+            self.inventory.on_balance_update(token=pending[0], usdc=pending[1])
 
     # -- Tick loop -------------------------------------------------------------
 
@@ -366,30 +473,63 @@ class WsState:
         assert self.emitter is not None
         assert self.grid is not None
 
-        desired = compute_desired_orders(
-            grid=self.grid,
-            effective_token=self.inventory.effective_token,
-            effective_usdc=self.inventory.effective_usdc,
-            order_sz=self.order_sz,
-            min_notional=self.min_notional,
-            active_levels=self.active_levels,
-        )
-
-        current = self.order_state.get_current_orders()
+        self._apply_pending_balance()
 
-        diff = compute_diff(
-            desired=desired,
-            current=current,
-            dead_zone_bps=self.dead_zone_bps,
-            price_tolerance_bps=self.price_tolerance_bps,
-            size_tolerance_pct=self.size_tolerance_pct,
+        # compute_desired_orders is pure, so unchanged inputs (the usual case
+        # between fills) reuse last tick's result.
+        desired_key = (
+            self.grid, self.inventory.effective_token, self.inventory.effective_usdc,
+            self.order_sz, self.min_notional, self.active_levels,
+        )
+        if desired_key == self._last_desired_key:
+            desired = self._last_desired
+        else:
+            desired = compute_desired_orders(
+                grid=self.grid,
+                effective_token=self.inventory.effective_token,
+                effective_usdc=self.inventory.effective_usdc,
+                order_sz=self.order_sz,
+                min_notional=self.min_notional,
+                active_levels=self.active_levels,
+            )
+            self._last_desired_key = desired_key
+            self._last_desired = desired
+
+        # A live view is enough: compute_diff runs without yielding, so the
+        # tracked orders cannot change underneath it.
+        current = self.order_state.iter_current_orders()
+        n_current = len(current)
+
+        # Same desired orders against an untouched book can only reproduce
+        # the empty diff of the last quiet tick, so skip diff and emit.
+        quiet_key = (
+            desired_key, self.order_state.version,
+            self.dead_zone_bps, self.price_tolerance_bps, self.size_tolerance_pct,
         )
+        if quiet_key == self._quiet_key:
+            emit_result = _QUIET_EMIT
+        else:
+            diff = compute_diff(
+                desired=desired,
+                current=current,
+                dead_zone_bps=self.dead_zone_bps,
+                price_tolerance_bps=self.price_tolerance_bps,
+                size_tolerance_pct=self.size_tolerance_pct,
+            )
+            if diff.cancels or diff.modifies or diff.places:
+                self._quiet_key = None
+                emit_result = await self.emitter.emit(diff, self.rate_limit)
+            else:
+                self._quiet_key = quiet_key
+                emit_result = _QUIET_EMIT
 
-        emit_result = await self.emitter.emit(diff, self.rate_limit)
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
 
-        # Derive cursor for logging
+        # Derive cursor for logging.  It follows from inventory alone, so no
+        # scan of the tracked orders is needed to locate the bid/ask boundary.
         eff_token = self.inventory.effective_token
-        n_full = math.floor(eff_token / self.order_sz) if eff_token > 0 else 0
+        n_full = int(eff_token / self.order_sz) if eff_token > 0 else 0
         partial = eff_token % self.order_sz if eff_token > 0 else 0.0
         total_ask = min(n_full + (1 if partial > 0 else 0), self.grid.n_orders)
         cursor = self.grid.n_orders - total_ask
@@ -402,13 +542,20 @@ class WsState:
         logger.debug(
             "Tick %d: cursor=%d px=%.6f desired=%d current=%d | "
             "placed=%d modified=%d cancelled=%d errors=%d | %s",
-            self._tick_count, cursor, cursor_px, len(desired), len(current),
+            self._tick_count, cursor, cursor_px, len(desired), n_current,
             emit_result.n_placed, emit_result.n_modified, emit_result.n_cancelled,
-            emit_result.n_errors, self.rate_limit.log_status(),
+            emit_result.n_errors, self.rate_limit,
         )
 
     async def _tick_loop(self) -> None:
-        """Run the tick loop until shutdown is requested."""
+        """Run the tick loop until shutdown is requested.
+
+        Ticks are scheduled against fixed deadlines, so the spacing stays at
+        ``interval_s`` however long each tick's REST work takes.
+        """
+        loop = asyncio.get_running_loop()
+        t0 = loop.time()
+        slot = 0
         while not self._shutting_down:
             self._tick_count += 1
 
@@ -427,7 +574,15 @@ class WsState:
                 except Exception:
                     logger.exception("Reconciliation failed at tick %d", self._tick_count)
 
-            await asyncio.sleep(self.interval_s)
+            now = loop.time()
+            next_slot = _next_slot(slot, now - t0, self.interval_s)
+            if next_slot > slot + 1:
+                logger.warning(
+                    "Tick %d overran the %.1fs interval; skipping %d missed tick(s)",
+                    self._tick_count, self.interval_s, next_slot - slot - 1,
+                )
+            slot = next_slot
+            await asyncio.sleep(t0 + slot * self.interval_s - now)
 
     # -- Reconciliation --------------------------------------------------------
 
@@ -436,8 +591,13 @@ class WsState:
         assert self.emitter is not None
         assert self.inventory is not None
 
+        # Both snapshots are independent REST reads; fetch them concurrently.
+        open_orders, spot_state = await asyncio.gather(
+            self._rest(self._info.open_orders, self._address),
+            self._rest(self._info.spot_user_state, self._address),
+        )
+
         # 1. Reconcile orders
-        open_orders = await asyncio.to_thread(self._info.open_orders, self._address)
         exchange_oids: set[int] = set()
         for order in open_orders:
             if order.get("coin") == self.coin:
@@ -445,30 +605,25 @@ class WsState:
 
         result = self.order_state.reconcile(exchange_oids)
 
-        # Cancel orphaned orders
+        # Cancel orphaned orders, then drop ghosts from state in one batch
         if result.orphaned_oids:
             orphan_diff = OrderDiff(cancels=list(result.orphaned_oids))
             await self.emitter.emit(orphan_diff, self.rate_limit)
-            logger.info("Reconciliation: cancelled %d orphans", len(result.orphaned_oids))
-
-        # Remove ghost orders
-        for oid in result.ghost_oids:
-            self.order_state.remove_ghost(oid)
         if result.ghost_oids:
-            logger.info("Reconciliation: removed %d ghosts", len(result.ghost_oids))
+            self.order_state.remove_ghosts(result.ghost_oids)
+        if result.orphaned_oids or result.ghost_oids:
+            logger.info(
+                "Reconciliation: cancelled %d orphans, removed %d ghosts",
+                len(result.orphaned_oids), len(result.ghost_oids),
+            )
 
         # 2. Reconcile balances
-        spot_state = await asyncio.to_thread(
-            self._info.spot_user_state, self._address,
+        token_bal, usdc_bal = _extract_balances(
+            spot_state.get("balances", []), self._balance_coin,
         )
-        token_bal = 0.0
-        usdc_bal = 0.0
-        for bal in spot_state.get("balances", []):
-            if bal["coin"] == self._balance_coin:
-                token_bal = float(bal["total"])
-            elif bal["coin"] == "USDC":
-                usdc_bal = float(bal["total"])
-        self.inventory.on_balance_update(token=token_bal, usdc=usdc_bal)
+        # The REST snapshot supersedes any webData2 update still pending.
+        self._pending_balance = None
+        self.inventory.on_balance_update(token=token_bal or 0.0, usdc=usdc_bal or 0.0)
 
     # -- WS health monitoring --------------------------------------------------
 
@@ -521,15 +676,14 @@ class WsState:
 
         cancel_reqs = [{"coin": self.coin, "oid": oid} for oid in oids]
         try:
-            response = await asyncio.to_thread(self._exchange.bulk_cancel, cancel_reqs)
+            response = await self._rest(self._exchange.bulk_cancel, cancel_reqs)
             logger.info("Shutdown: bulk_cancel response: %s", response)
         except Exception:
             logger.exception("Shutdown: bulk_cancel failed, orders may remain on exchange")
             return
 
         # Clean up order state regardless of individual cancel statuses
-        for oid in oids:
-            self.order_state.remove_ghost(oid)
+        self.order_state.remove_ghosts(oids)
 
         logger.info("Shutdown: cancelled %d order(s), order state cleared", len(oids))
 
@@ -548,23 +702,36 @@ class WsState:
 
         Registers signal handlers for SIGINT and SIGTERM so that the tick
         loop stops cleanly and resting orders are cancelled before exit.
+        The inbox task, worker threads and WebSocket are released even if
+        startup or the tick loop raises.
         """
-        await self._startup()
-        self._subscribe()
-
-        loop = asyncio.get_running_loop()
-
-        def _signal_handler() -> None:
-            if self._shutting_down:
-                # Second signal — user is impatient, let asyncio handle it
-                logger.warning("Shutdown already in progress, please wait...")
-                return
-            self._shutting_down = True
-            logger.info("Signal received, initiating graceful shutdown...")
-
-        for sig in (signal.SIGINT, signal.SIGTERM):
-            loop.add_signal_handler(sig, _signal_handler)
-
-        await self._tick_loop()
-        await self._shutdown()
-        self._close_websocket()
+        inbox_task: asyncio.Task[None] | None = None
+        try:
+            await self._startup()
+            inbox_task = asyncio.create_task(self._drain_inbox())
+            self._subscribe()
+
+            loop = asyncio.get_running_loop()
+
+            def _signal_handler() -> None:
+                if self._shutting_down:
+                    # Second signal — user is impatient, let asyncio handle it
+                    logger.warning("Shutdown already in progress, please wait...")
+                    return
+                self._shutting_down = True
+                logger.info("Signal received, initiating graceful shutdown...")
+
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.add_signal_handler(sig, _signal_handler)
+
+            await self._tick_loop()
+            await self._shutdown()
+        finally:
+            if inbox_task is not None:
+                inbox_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await inbox_task
+            if self.emitter is not None:
+                await self.emitter.aclose()
+            self._rest_executor.shutdown(wait=False)
+            self._close_websocket()
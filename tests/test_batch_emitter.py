@@ -5,6 +5,7 @@ from __future__ import annotations
 from unittest.mock import MagicMock
 
 import pytest
+import pytest_asyncio
 
 from pyperliquidity.batch_emitter import (
     BALANCE_COOLDOWN_S,
@@ -17,6 +18,21 @@ from pyperliquidity.order_state import OrderState
 from pyperliquidity.quoting_engine import DesiredOrder
 from pyperliquidity.rate_limit import RateLimitBudget
 
+# Every test here is a self-contained emit() call, and _close_emitters shuts
+# down each emitter's worker thread afterwards, so nothing is left running and
+# the tests can share one event loop instead of one per test.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+# Emitters built by _make_emitter during the current test.
+_open_emitters: list[BatchEmitter] = []
+
+
+@pytest_asyncio.fixture(loop_scope="module", autouse=True)
+async def _close_emitters():
+    yield
+    while _open_emitters:
+        await _open_emitters.pop().aclose()
+
 # --- Helpers ------------------------------------------------------------------
 
 def _ok(statuses: list[dict]) -> dict:
@@ -28,18 +44,27 @@ def _desired(side: str = "buy", level: int = 0, px: float = 1.0, sz: float = 10.
     return DesiredOrder(side=side, level_index=level, price=px, size=sz)
 
 
+# The only SDK Exchange methods the emitter calls.  Spec'd mocks reject any
+# other attribute, so a typo in a test fails loudly instead of silently
+# configuring a child mock nobody calls.  MagicMock stays over a hand-rolled
+# stub: it is well under a millisecond per test, and the tests lean on its
+# side_effect, call_args and assert_* helpers.
+_EXCHANGE_METHODS = ["bulk_cancel", "bulk_modify_orders_new", "bulk_orders"]
+
+
 def _make_emitter(
     exchange: MagicMock | None = None,
     order_state: OrderState | None = None,
     clock_time: float = 0.0,
 ) -> tuple[BatchEmitter, MagicMock, OrderState, MagicMock]:
     """Build a BatchEmitter with defaults and return all components."""
-    ex = exchange or MagicMock()
+    ex = exchange or MagicMock(spec=_EXCHANGE_METHODS)
     os = order_state or OrderState()
     clock = MagicMock(return_value=clock_time)
     emitter = BatchEmitter(
         coin="TEST", asset_id=10001, exchange=ex, order_state=os, clock=clock,
     )
+    _open_emitters.append(emitter)
     return emitter, ex, os, clock
 
 
@@ -255,9 +280,8 @@ async def test_insufficient_balance_sets_cooldown():
     budget = _budget()
     await emitter.emit(diff, budget)
 
-    # Cooldown should be set for (TEST, sell)
-    assert (emitter.coin, "sell") in emitter._cooldowns
-    expiry = emitter._cooldowns[(emitter.coin, "sell")]
+    # Cooldown should be set for the sell side
+    expiry = emitter._cool_expiry[False]
     assert expiry == pytest.approx(100.0 + BALANCE_COOLDOWN_S)
 
 
@@ -266,7 +290,7 @@ async def test_insufficient_balance_sets_cooldown():
 async def test_cooldown_suppresses_placements():
     emitter, ex, os, clock = _make_emitter(clock_time=100.0)
     # Set a cooldown on sell side that expires at 160
-    emitter._cooldowns[(emitter.coin, "sell")] = 160.0
+    emitter._cool_expiry[False] = 160.0
 
     ex.bulk_orders.return_value = _ok([{"resting": {"oid": 400}}])
 
@@ -291,7 +315,7 @@ async def test_successful_placement_clears_cooldown():
     emitter, ex, os, clock = _make_emitter(clock_time=200.0)
     # Cooldown already expired (set expiry in the past so it clears on check)
     # Actually, let's test: place succeeds → cooldown is cleared
-    emitter._cooldowns[(emitter.coin, "buy")] = 190.0  # already expired
+    emitter._cool_expiry[True] = 190.0  # already expired
 
     ex.bulk_orders.return_value = _ok([{"resting": {"oid": 500}}])
 
@@ -299,7 +323,7 @@ async def test_successful_placement_clears_cooldown():
     budget = _budget()
     await emitter.emit(diff, budget)
 
-    assert (emitter.coin, "buy") not in emitter._cooldowns
+    assert emitter._cool_expiry[True] == 0.0
 
 
 # --- 5.8 ALO rejections not counted ------------------------------------------
@@ -323,9 +347,9 @@ async def test_alo_rejection_not_counted_as_generic_reject():
     assert result.n_errors == 3
     assert result.n_placed == 0
     # No cooldown should be set
-    assert len(emitter._cooldowns) == 0
+    assert emitter._cool_expiry == [0.0, 0.0]
     # Consecutive rejects counter should be 0
-    assert emitter._consecutive_rejects.get("buy", 0) == 0
+    assert emitter._consecutive_rejects[True] == 0
 
 
 async def test_generic_rejects_trigger_cooldown_at_threshold():
@@ -342,8 +366,7 @@ async def test_generic_rejects_trigger_cooldown_at_threshold():
     await emitter.emit(diff, budget)
 
     # 3 consecutive generic rejects → cooldown
-    assert (emitter.coin, "buy") in emitter._cooldowns
-    expiry = emitter._cooldowns[(emitter.coin, "buy")]
+    expiry = emitter._cool_expiry[True]
     assert expiry == pytest.approx(0.0 + REJECT_COOLDOWN_S)
 
 
@@ -436,12 +459,21 @@ async def test_cancel_error_still_removes_from_state():
 
 # --- 5.13 Unknown modify status removes order --------------------------------
 
-async def test_unknown_modify_status_removes_from_state():
+@pytest.mark.parametrize(
+    "statuses",
+    [
+        # Unexpected status (e.g., "filled") → unhandled
+        [{"filled": {"totalSz": "10.0"}}],
+        # Fewer statuses than requests → propagated "batch truncated" error
+        [],
+    ],
+    ids=["unknown_status", "truncated_response"],
+)
+async def test_unhandled_modify_response_removes_from_state(statuses):
     emitter, ex, os, _ = _make_emitter()
     os.on_place_confirmed(oid=100, side="buy", level_index=5, price=1.0, size=10.0)
 
-    # Return an unexpected status (e.g., "filled" or empty dict)
-    ex.bulk_modify_orders_new.return_value = _ok([{"filled": {"totalSz": "10.0"}}])
+    ex.bulk_modify_orders_new.return_value = _ok(statuses)
 
     diff = OrderDiff(modifies=[(100, _desired(side="buy", level=5, px=1.1))])
     budget = _budget()
@@ -453,21 +485,6 @@ async def test_unknown_modify_status_removes_from_state():
     assert result.n_errors == 1
 
 
-async def test_truncated_modify_response_removes_from_state():
-    emitter, ex, os, _ = _make_emitter()
-    os.on_place_confirmed(oid=100, side="buy", level_index=5, price=1.0, size=10.0)
-
-    # Fewer statuses than requests → propagated "batch truncated" error
-    ex.bulk_modify_orders_new.return_value = _ok([])
-
-    diff = OrderDiff(modifies=[(100, _desired(side="buy", level=5, px=1.1))])
-    budget = _budget()
-    result = await emitter.emit(diff, budget)
-
-    assert 100 not in os.orders_by_oid
-    assert result.n_errors == 1
-
-
 # --- 5.15 Truncated batch response propagation --------------------------------
 
 async def test_truncated_place_response_propagates_first_error():
@@ -591,3 +608,62 @@ async def test_budget_debited_on_sdk_exception():
 
     # Budget should still be debited even though the call raised
     assert budget.n_requests == initial_requests + 1
+
+
+async def test_failed_batch_stops_later_batches():
+    emitter, ex, os, _ = _make_emitter()
+
+    ex.bulk_cancel.side_effect = ConnectionError("network error")
+    ex.bulk_orders.return_value = _ok([{"resting": {"oid": 300}}])
+
+    diff = OrderDiff(cancels=[1], places=[_desired(level=2)])
+    budget = _budget()
+    initial_requests = budget.n_requests
+
+    with pytest.raises(ConnectionError):
+        await emitter.emit(diff, budget)
+
+    # The place relies on the balance the cancel would free: never sent.
+    ex.bulk_orders.assert_not_called()
+    assert 300 not in os.orders_by_oid
+    assert budget.n_requests == initial_requests + 1
+
+
+async def test_failed_batch_keeps_earlier_responses():
+    emitter, ex, os, _ = _make_emitter()
+
+    ex.bulk_cancel.return_value = _ok([{}])
+    ex.bulk_orders.side_effect = ConnectionError("network error")
+    os.on_place_confirmed(oid=1, side="sell", level_index=0, price=1.0, size=1.0)
+
+    diff = OrderDiff(cancels=[1], places=[_desired(level=2)])
+    budget = _budget()
+    initial_requests = budget.n_requests
+
+    with pytest.raises(ConnectionError):
+        await emitter.emit(diff, budget)
+
+    assert 1 not in os.orders_by_oid
+    assert budget.n_requests == initial_requests + 2
+
+
+# --- 5.16 Persistent executor ------------------------------------------------
+
+async def test_sdk_calls_run_on_emitter_thread():
+    import threading
+
+    emitter, ex, _, _ = _make_emitter()
+    thread_names: list[str] = []
+
+    def track_place(reqs):
+        thread_names.append(threading.current_thread().name)
+        return _ok([{"resting": {"oid": 1}}])
+
+    ex.bulk_orders.side_effect = track_place
+
+    await emitter.emit(OrderDiff(places=[_desired(level=0)]), _budget())
+    await emitter.emit(OrderDiff(places=[_desired(level=1)]), _budget())
+
+    assert len(thread_names) == 2
+    assert all(name.startswith("emitter") for name in thread_names)
+    await emitter.aclose()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import os
 import textwrap
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -41,27 +42,46 @@ def _write_toml(tmp_path: Path, content: str) -> Path:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def toml_files(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    """Read-only config files, written once for the module."""
+    d = tmp_path_factory.mktemp("cfg")
+    files = {
+        "malformed": (d / "malformed.toml", "[[invalid\n"),
+        "valid": (d / "valid.toml", '[market]\ncoin = "PURR"\n'),
+    }
+    for path, content in files.values():
+        path.write_text(content)
+    return {name: path for name, (path, _) in files.items()}
+
+
 class TestLoadConfig:
     def test_missing_file(self) -> None:
         with pytest.raises(SystemExit, match="Config file not found"):
             _load_config("/nonexistent/config.toml")
 
-    def test_malformed_toml(self, tmp_path: Path) -> None:
-        p = _write_toml(tmp_path, "[[invalid\n")
+    def test_malformed_toml(self, toml_files: dict[str, Path]) -> None:
         with pytest.raises(SystemExit, match="Failed to parse"):
-            _load_config(str(p))
-
-    def test_valid_toml(self, tmp_path: Path) -> None:
-        p = _write_toml(
-            tmp_path,
-            """\
-            [market]
-            coin = "PURR"
-            """,
-        )
-        result = _load_config(str(p))
+            _load_config(str(toml_files["malformed"]))
+
+    def test_valid_toml(self, toml_files: dict[str, Path]) -> None:
+        result = _load_config(str(toml_files["valid"]))
         assert result["market"]["coin"] == "PURR"
 
+    def test_reload_returns_independent_copy(self, toml_files: dict[str, Path]) -> None:
+        p = toml_files["valid"]
+        first = _load_config(str(p))
+        first["market"]["coin"] = "MUTATED"
+        assert _load_config(str(p))["market"]["coin"] == "PURR"
+
+    def test_reload_picks_up_changes(self, tmp_path: Path) -> None:
+        p = _write_toml(tmp_path, '[market]\ncoin = "PURR"\n')
+        assert _load_config(str(p))["market"]["coin"] == "PURR"
+        st = p.stat()
+        p.write_text('[market]\ncoin = "HYPE"\n')
+        os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert _load_config(str(p))["market"]["coin"] == "HYPE"
+
 
 # ---------------------------------------------------------------------------
 # _load_env
@@ -69,28 +89,27 @@ class TestLoadConfig:
 
 
 class TestLoadEnv:
-    def test_missing_private_key(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    @pytest.mark.parametrize(
+        ("env", "match"),
+        [
+            ({}, "PRIVATE_KEY"),
+            (
+                {"PYPERLIQUIDITY_PRIVATE_KEY": "  ", "PYPERLIQUIDITY_WALLET": "0xabc"},
+                "PRIVATE_KEY",
+            ),
+            ({"PYPERLIQUIDITY_PRIVATE_KEY": "0xdeadbeef"}, "WALLET"),
+            ({"PYPERLIQUIDITY_PRIVATE_KEY": "0xdeadbeef", "PYPERLIQUIDITY_WALLET": ""}, "WALLET"),
+        ],
+        ids=["missing_private_key", "empty_private_key", "missing_wallet", "empty_wallet"],
+    )
+    def test_missing_or_empty_var(
+        self, monkeypatch: pytest.MonkeyPatch, env: dict[str, str], match: str,
+    ) -> None:
         monkeypatch.delenv("PYPERLIQUIDITY_PRIVATE_KEY", raising=False)
         monkeypatch.delenv("PYPERLIQUIDITY_WALLET", raising=False)
-        with pytest.raises(SystemExit, match="PRIVATE_KEY"):
-            _load_env()
-
-    def test_empty_private_key(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.setenv("PYPERLIQUIDITY_PRIVATE_KEY", "  ")
-        monkeypatch.setenv("PYPERLIQUIDITY_WALLET", "0xabc")
-        with pytest.raises(SystemExit, match="PRIVATE_KEY"):
-            _load_env()
-
-    def test_missing_wallet(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.setenv("PYPERLIQUIDITY_PRIVATE_KEY", "0xdeadbeef")
-        monkeypatch.delenv("PYPERLIQUIDITY_WALLET", raising=False)
-        with pytest.raises(SystemExit, match="WALLET"):
-            _load_env()
-
-    def test_empty_wallet(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.setenv("PYPERLIQUIDITY_PRIVATE_KEY", "0xdeadbeef")
-        monkeypatch.setenv("PYPERLIQUIDITY_WALLET", "")
-        with pytest.raises(SystemExit, match="WALLET"):
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+        with pytest.raises(SystemExit, match=match):
             _load_env()
 
     def test_both_set(self, monkeypatch: pytest.MonkeyPatch) -> None:
@@ -156,6 +175,18 @@ class TestValidateConfig:
         # Others get defaults
         assert result["tuning"]["reconcile_every"] == 20
 
+    def test_tuning_dicts_are_independent(self) -> None:
+        """Each validated config gets its own tuning dict; defaults stay intact."""
+        first = _validate_config({**VALID_CONFIG})
+        first["tuning"]["interval_s"] = 99.0
+        second = _validate_config({**VALID_CONFIG})
+        assert second["tuning"]["interval_s"] == 3.0
+
+    def test_unknown_tuning_keys_dropped(self) -> None:
+        cfg = {**VALID_CONFIG, "tuning": {"bogus": 1}}
+        result = _validate_config(cfg)
+        assert "bogus" not in result["tuning"]
+
     def test_missing_start_px(self) -> None:
         cfg = {**VALID_CONFIG, "strategy": {"n_orders": 10, "order_sz": 100.0}}
         with pytest.raises(SystemExit, match="start_px"):
@@ -269,6 +269,34 @@ class TestFillSequence:
 # ===========================================================================
 
 
+class TestFillBurst:
+    def test_on_fills_matches_sequential_handlers(self) -> None:
+        fills = [
+            ("sell", 1.01, 3.0, 0.01, "USDC"),
+            ("buy", 0.99, 2.5, 0.02, "TOKEN"),
+            ("sell", 1.02, 0.7, 0.0, "USDC"),
+            ("buy", 0.98, 4.0, 0.03, "USDC"),
+        ]
+        seq = _make_inv(acct_token=50.0, acct_usdc=50.0)
+        for side, px, sz, fee, fee_token in fills:
+            handler = seq.on_ask_fill if side == "sell" else seq.on_bid_fill
+            handler(px=px, sz=sz, fee=fee, fee_token=fee_token)
+
+        burst = _make_inv(acct_token=50.0, acct_usdc=50.0)
+        burst.on_fills(fills)
+
+        assert burst.virtual_token == seq.virtual_token
+        assert burst.virtual_usdc == seq.virtual_usdc
+        assert burst.effective_token == seq.effective_token
+        assert burst.effective_usdc == seq.effective_usdc
+
+    def test_on_fills_empty_is_noop(self) -> None:
+        inv = _make_inv()
+        before = (inv.virtual_token, inv.virtual_usdc, inv.effective_token)
+        inv.on_fills([])
+        assert (inv.virtual_token, inv.virtual_usdc, inv.effective_token) == before
+
+
 class TestEdgeCases:
     def test_effective_never_exceeds_min_virtual_account(self) -> None:
         for at, al in [(100, 50), (50, 100), (0, 100), (100, 0)]:
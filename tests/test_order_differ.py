@@ -37,9 +37,16 @@ class TestIdentical:
             _tracked(2, "sell", 5, 101.5, 10.0),
         ]
         diff = compute_diff(desired, current, **TIGHT)
-        assert diff.modifies == []
-        assert diff.places == []
-        assert diff.cancels == []
+        assert not diff.modifies
+        assert not diff.places
+        assert not diff.cancels
+
+    def test_empty_diff_shares_no_mutable_state(self):
+        assert OrderDiff() == ((), (), ())
+        diff = compute_diff([], [], **TIGHT)
+        assert diff == OrderDiff()
+        assert isinstance(diff.places, tuple)
+        assert OrderDiff(places=[_desired("buy", 0, 100.0, 10.0)]).cancels == ()
 
 
 # ---------------------------------------------------------------------------
@@ -104,8 +111,8 @@ class TestDeadZoneBypass:
         ]
         diff = compute_diff(desired, [], **LOOSE)
         assert len(diff.places) == 2
-        assert diff.modifies == []
-        assert diff.cancels == []
+        assert not diff.modifies
+        assert not diff.cancels
 
     def test_empty_desired_returns_all_cancels(self):
         current = [
@@ -114,8 +121,8 @@ class TestDeadZoneBypass:
         ]
         diff = compute_diff([], current, **LOOSE)
         assert set(diff.cancels) == {1, 2}
-        assert diff.modifies == []
-        assert diff.places == []
+        assert not diff.modifies
+        assert not diff.places
 
     def test_both_empty_returns_empty_diff(self):
         diff = compute_diff([], [], **LOOSE)
@@ -159,7 +166,7 @@ class TestPerOrderTolerance:
         current = [_tracked(1, "buy", 0, 100.0, 10.0)]
         diff = compute_diff(desired, current, dead_zone_bps=0.0,
                             price_tolerance_bps=1.0, size_tolerance_pct=5.0)
-        assert diff.modifies == []
+        assert not diff.modifies
 
     def test_exceeds_price_tolerance_emits_modify(self):
         # Price diff = 0.02 / 100 * 10000 = 2 bps (> 1.0)
@@ -188,7 +195,7 @@ class TestCrossSide:
         current = [_tracked(1, "buy", 5, 99.5, 10.0)]
         diff = compute_diff(desired, current, **TIGHT)
         # Must NOT be a modify — should be cancel + place
-        assert diff.modifies == []
+        assert not diff.modifies
         assert diff.cancels == [1]
         assert len(diff.places) == 1
         assert diff.places[0].side == "sell"
@@ -198,8 +205,8 @@ class TestCrossSide:
         current = [_tracked(1, "buy", 3, 100.0, 10.0)]
         diff = compute_diff(desired, current, **TIGHT)
         assert len(diff.modifies) == 1
-        assert diff.cancels == []
-        assert diff.places == []
+        assert not diff.cancels
+        assert not diff.places
 
     def test_level_flip_on_cursor_shift(self):
         """Cursor shift causes level 5 to flip from ask to bid → cancel + place."""
@@ -215,12 +222,24 @@ class TestCrossSide:
         ]
         diff = compute_diff(desired, current, **TIGHT)
         # Both should be cancel + place (cross-side), no modifies
-        assert diff.modifies == []
+        assert not diff.modifies
         assert set(diff.cancels) == {1, 2}
         assert len(diff.places) == 2
         placed_sides = {p.side for p in diff.places}
         assert placed_sides == {"buy"}
 
+    def test_cross_side_cancel_is_never_also_modified(self):
+        """An order consumed by a cross-side swap can't match its own side later."""
+        desired = [
+            _desired("sell", 5, 101.5, 10.0),
+            _desired("buy", 5, 99.0, 10.0),
+        ]
+        current = [_tracked(1, "buy", 5, 99.5, 10.0)]
+        diff = compute_diff(desired, current, **TIGHT)
+        assert not diff.modifies
+        assert diff.cancels == [1]
+        assert len(diff.places) == 2
+
 
 # ---------------------------------------------------------------------------
 # 3.7  Determinism
@@ -263,8 +282,8 @@ class TestEdgeCases:
         # Buy size changed (10 → 7.5), sell unchanged
         assert len(diff.modifies) == 1
         assert diff.modifies[0][0] == 10  # buy order OID
-        assert diff.places == []
-        assert diff.cancels == []
+        assert not diff.places
+        assert not diff.cancels
 
     def test_both_lists_empty(self):
         diff = compute_diff([], [], **TIGHT)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import sys
+
 from pyperliquidity.order_state import OrderState, OrderStatus
 
 # ---------------------------------------------------------------------------
@@ -43,6 +45,13 @@ class TestPlaceConfirmation:
         assert order.price == 2.10
         assert order.size == 5.0
         assert order.status == OrderStatus.RESTING
+        assert order.key == ("sell", 7)
+
+    def test_runtime_side_string_is_canonicalized(self) -> None:
+        state = _make_state()
+        side = "".join(["s", "ell"])  # built at runtime, not interned
+        _place(state, oid=200, side=side, level_index=7)
+        assert state.orders_by_oid[200].side is sys.intern("sell")
 
     def test_dual_index_consistency_multiple_orders(self) -> None:
         state = _make_state()
@@ -183,6 +192,15 @@ class TestPartialFill:
         assert ("sell", 3) in state.orders_by_key
         assert state.orders_by_oid[100].size == 7.0
 
+    def test_partial_fill_bumps_version(self) -> None:
+        state = _make_state()
+        _place(state, oid=100, side="sell", level_index=3, price=2.0, size=10.0)
+        before = state.version
+
+        state.on_fill(tid=2001, oid=100, fill_sz=3.0)
+
+        assert state.version > before
+
 
 # ===========================================================================
 # 4.6 Full fill removes order
@@ -215,6 +233,16 @@ class TestFullFill:
         assert result.fully_filled is True
         assert 100 not in state.orders_by_oid
 
+    def test_result_is_a_tuple(self) -> None:
+        state = _make_state()
+        _place(state, oid=100, side="buy", level_index=5, price=1.50, size=10.0)
+
+        result = state.on_fill(tid=3003, oid=100, fill_sz=10.0)
+
+        assert result == ("buy", 5, 1.50, 10.0, True)
+        side, level_index, price, size, fully_filled = result
+        assert (side, level_index, fully_filled) == ("buy", 5, True)
+
 
 # ===========================================================================
 # 4.7 Reconcile detects orphaned and ghost orders
@@ -261,6 +289,58 @@ class TestReconcile:
 
         assert result.orphaned_oids == frozenset({300})
         assert result.ghost_oids == frozenset({200})
+        assert result == ({300}, {200})
+        orphaned, ghosts = result
+        assert (orphaned, ghosts) == ({300}, {200})
+
+    def test_in_sync_returns_shared_empty_result(self) -> None:
+        state = _make_state()
+        _place(state, oid=100, side="buy", level_index=1)
+        _place(state, oid=200, side="sell", level_index=2)
+        state.mark_pending_modify(200)
+
+        first = state.reconcile({100, 200})
+        assert first.orphaned_oids == frozenset()
+        assert first.ghost_oids == frozenset()
+
+        other = _make_state()
+        assert other.reconcile(set()) is first
+
+    def test_results_are_frozen(self) -> None:
+        state = _make_state()
+        _place(state, oid=100, side="buy", level_index=1)
+        _place(state, oid=200, side="sell", level_index=2)
+
+        for result in (state.reconcile({100, 300}), state.reconcile({100, 300}),
+                       _make_state().reconcile(set())):
+            assert isinstance(result.orphaned_oids, frozenset)
+            assert isinstance(result.ghost_oids, frozenset)
+
+    def test_unchanged_state_reuses_result(self) -> None:
+        state = _make_state()
+        _place(state, oid=100, side="buy", level_index=1)
+
+        first = state.reconcile({100, 300})
+        assert state.reconcile({100, 300}) is first
+
+    def test_mutation_or_new_snapshot_recomputes(self) -> None:
+        state = _make_state()
+        _place(state, oid=100, side="buy", level_index=1)
+        _place(state, oid=200, side="sell", level_index=2)
+
+        first = state.reconcile({100})
+        assert first.ghost_oids == frozenset({200})
+
+        # Different exchange snapshot.
+        assert state.reconcile({100, 200}).ghost_oids == frozenset()
+
+        # Same snapshot, but 200 went pending — no longer a ghost candidate.
+        state.reconcile({100})
+        state.mark_pending_cancel(200)
+        assert state.reconcile({100}).ghost_oids == frozenset()
+
+        state.remove_ghost(200)
+        assert state.reconcile({100, 200}).orphaned_oids == frozenset({200})
 
 
 # ===========================================================================
@@ -278,25 +358,34 @@ class TestSeenTidsPruning:
             _place(state, oid=tid + 1000, side="buy", level_index=tid)
             state.on_fill(tid=tid, oid=tid + 1000, fill_sz=10.0)
 
-        # After pruning, should have kept the newest half.
+        # The oldest tid is evicted once the cap is reached.
         assert len(state._seen_tids) <= cap
         # The newest tids should still be present.
         assert cap in state._seen_tids
         # Old tids should be pruned.
         assert 0 not in state._seen_tids
 
-    def test_prune_keeps_newest_half(self) -> None:
+    def test_prune_keeps_newest_window(self) -> None:
         cap = 10
         state = _make_state(seen_tids_cap=cap)
 
-        for tid in range(cap + 1):
+        for tid in range(3 * cap):
             _place(state, oid=tid + 1000, side="buy", level_index=tid)
             state.on_fill(tid=tid, oid=tid + 1000, fill_sz=10.0)
 
-        # After pruning: should have ~6 tids (kept 5 newest + new one).
-        assert len(state._seen_tids) <= cap
-        # Newest tid present.
-        assert cap in state._seen_tids
+        # Exactly the last ``cap`` tids are retained.
+        assert state._seen_tids == set(range(2 * cap, 3 * cap))
+        # An evicted tid is no longer treated as a duplicate.
+        assert state.on_fill(tid=0, oid=999, fill_sz=1.0) is None
+        assert 0 in state._seen_tids
+
+    def test_zero_cap_keeps_newest_tid(self) -> None:
+        state = _make_state(seen_tids_cap=0)
+        _place(state, oid=1000, side="buy", level_index=0)
+        assert state.on_fill(tid=1, oid=1000, fill_sz=1.0) is not None
+        assert state.on_fill(tid=1, oid=1000, fill_sz=1.0) is None
+        state.on_fill(tid=2, oid=1000, fill_sz=1.0)
+        assert state._seen_tids == {2}
 
 
 # ===========================================================================
@@ -356,6 +445,24 @@ class TestRemoveGhost:
         state.remove_ghost(999)  # Should not raise.
         assert len(state.orders_by_oid) == 0
 
+    def test_remove_ghosts_batch(self) -> None:
+        state = _make_state()
+        _place(state, oid=100, side="buy", level_index=5)
+        _place(state, oid=101, side="sell", level_index=6)
+        _place(state, oid=102, side="sell", level_index=7)
+        version = state.version
+        state.remove_ghosts([100, 102, 999])
+        assert set(state.orders_by_oid) == {101}
+        assert set(state.orders_by_key) == {("sell", 6)}
+        assert state.version == version + 1
+
+    def test_remove_ghosts_nothing_removed_keeps_version(self) -> None:
+        state = _make_state()
+        _place(state, oid=100, side="buy", level_index=5)
+        version = state.version
+        state.remove_ghosts([999])
+        assert state.version == version
+
 
 class TestGetCurrentOrders:
     def test_returns_all_orders(self) -> None:
@@ -373,6 +480,15 @@ class TestGetCurrentOrders:
         state = _make_state()
         assert state.get_current_orders() == []
 
+    def test_iter_is_live_view(self) -> None:
+        state = _make_state()
+        _place(state, oid=1, side="buy", level_index=0)
+        view = state.iter_current_orders()
+        assert [o.oid for o in view] == [1]
+
+        _place(state, oid=2, side="sell", level_index=3)
+        assert {o.oid for o in view} == {1, 2}
+
 
 # ===========================================================================
 # Near-zero fill size threshold
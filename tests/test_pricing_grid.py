@@ -5,6 +5,7 @@ import pytest
 from pyperliquidity.pricing_grid import (
     PricingGrid,
     _default_round,
+    cached_grid,
     compute_allocation_from_target_px,
 )
 
@@ -107,6 +108,11 @@ class TestLevelForPrice:
         for i, level in enumerate(grid.levels):
             assert grid.level_for_price(level) == i
 
+    def test_exact_match_from_exchange_string(self, grid: PricingGrid) -> None:
+        # Exchange echoes limitPx as a string; parsing it back hits the level.
+        for i, level in enumerate(grid.levels):
+            assert grid.level_for_price(float(str(level))) == i
+
     def test_between_levels_closer_to_right(self, grid: PricingGrid) -> None:
         # Price closer to levels[3] than levels[2]
         px = grid.levels[2] * 0.2 + grid.levels[3] * 0.8
@@ -138,6 +144,14 @@ class TestLevelForPrice:
         px = grid.levels[-1] + grid.levels[-1] * grid.tick_size * 0.1
         assert grid.level_for_price(px) == len(grid.levels) - 1
 
+    def test_level_index_for_off_grid_is_minus_one(self, grid: PricingGrid) -> None:
+        assert grid.level_index_for(0.5) == -1
+        assert grid.level_index_for(999.0) == -1
+
+    def test_level_index_for_agrees_on_grid(self, grid: PricingGrid) -> None:
+        for px in (*grid.levels, (grid.levels[2] + grid.levels[3]) / 2, grid.levels[4] * 1.001):
+            assert grid.level_index_for(px) == grid.level_for_price(px)
+
 
 # --- 3.6 price_at_level ---
 
@@ -178,6 +192,31 @@ class TestImmutability:
             grid._levels = (1.0, 2.0)  # type: ignore[misc]
 
 
+# --- 3.7b Shared grids ---
+
+
+class TestCachedGrid:
+    def test_same_params_share_instance(self) -> None:
+        a = cached_grid(start_px=1.0, n_orders=10, tick_size=0.003)
+        b = cached_grid(start_px=1.0, n_orders=10, tick_size=0.003)
+        assert a is b
+
+    def test_matches_direct_construction(self) -> None:
+        grid = cached_grid(start_px=0.020777, n_orders=40)
+        assert grid == PricingGrid(start_px=0.020777, n_orders=40)
+
+    def test_int_and_float_start_px_not_aliased(self) -> None:
+        as_float = cached_grid(start_px=2.0, n_orders=5)
+        as_int = cached_grid(start_px=2, n_orders=5)
+        assert as_float is not as_int
+        assert isinstance(as_float.levels[0], float)
+
+    def test_degenerate_still_raises(self) -> None:
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Degenerate grid"):
+                cached_grid(start_px=1.0, n_orders=10, tick_size=0.000001)
+
+
 # --- 3.8 5sf rounding verification against HIP-2 ---
 
 
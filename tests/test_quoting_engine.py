@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import ast
 import inspect
+import math
+import random
 
 import pytest
 
@@ -17,7 +19,7 @@ def _grid(n: int = 10, start_px: float = 1.0) -> PricingGrid:
     return PricingGrid(start_px=start_px, n_orders=n)
 
 
-# --- DesiredOrder dataclass ---
+# --- DesiredOrder ---
 
 
 class TestDesiredOrder:
@@ -52,6 +54,18 @@ class TestDesiredOrder:
         s = {a, b}
         assert len(s) == 1
 
+    def test_tuple_semantics(self) -> None:
+        o = DesiredOrder(side="sell", level_index=5, price=1.003, size=10.0)
+        assert o == ("sell", 5, 1.003, 10.0)
+        assert hash(o) == hash(("sell", 5, 1.003, 10.0))
+        side, level_index, price, size = o
+        assert (side, level_index, price, size) == ("sell", 5, 1.003, 10.0)
+        assert list(o) == ["sell", 5, 1.003, 10.0]
+
+    def test_is_buy_derived_from_side(self) -> None:
+        assert DesiredOrder(side="buy", level_index=0, price=1.0, size=1.0).is_buy is True
+        assert DesiredOrder(side="sell", level_index=0, price=1.0, size=1.0).is_buy is False
+
 
 # --- Cursor derivation ---
 
@@ -99,6 +113,22 @@ class TestCursorDerivation:
         assert len(asks) == 10
         assert all(a.size == 1000.0 for a in asks)
 
+    def test_ask_sizes_sum_to_tokens_randomized(self) -> None:
+        """n_full * order_sz + partial reproduces the token balance.
+
+        Seeded random balances, including exact multiples of order_sz, kept
+        below the grid's capacity so no asks are clipped.
+        """
+        grid = _grid(200)
+        rng = random.Random(0)
+        balances = [rng.uniform(0.0, 199.0) for _ in range(500)]
+        balances += [float(n) for n in range(0, 200, 7)]
+        for tokens in balances:
+            orders = compute_desired_orders(grid, tokens, 0.0, 1.0)
+            asks = [o for o in orders if o.side == "sell"]
+            assert math.isclose(sum(a.size for a in asks), tokens, abs_tol=1e-9)
+            assert all(0.0 < a.size <= 1.0 for a in asks)
+
 
 # --- Ask placement ---
 
@@ -343,6 +373,17 @@ class TestEdgeCases:
         r2 = compute_desired_orders(grid, 10000.0, 5000.0, 1000.0)
         assert r1 == r2
 
+    def test_full_size_orders_reused_across_ticks(self) -> None:
+        """Full-size orders are shared instances; partials are rebuilt."""
+        grid = _grid(20)
+        r1 = compute_desired_orders(grid, 9500.0, 5500.0, 1000.0)
+        r2 = compute_desired_orders(grid, 9500.0, 5500.0, 1000.0)
+        for a, b in zip(r1, r2):
+            if a.size == 1000.0:
+                assert a is b
+            else:
+                assert a == b
+
 
 # --- Active levels windowing ---
 
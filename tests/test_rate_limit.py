@@ -1,5 +1,7 @@
 """Tests for the rate_limit module."""
 
+import pytest
+
 from pyperliquidity.rate_limit import RateLimitBudget
 
 
@@ -28,40 +30,34 @@ class TestBudgetComputation:
 
 
 class TestRatio:
-    def test_ratio_zero_requests(self):
-        rl = RateLimitBudget()
-        assert rl.ratio == 0.0
-
-    def test_ratio_healthy(self):
-        rl = RateLimitBudget(cum_vlm=1000.0, n_requests=800)
-        assert rl.ratio == 1.25
-
-    def test_ratio_unhealthy(self):
-        rl = RateLimitBudget(cum_vlm=500.0, n_requests=800)
-        assert rl.ratio == 0.625
+    @pytest.mark.parametrize(
+        ("cum_vlm", "n_requests", "expected"),
+        [(0.0, 0, 0.0), (1000.0, 800, 1.25), (500.0, 800, 0.625)],
+        ids=["zero_requests", "healthy", "unhealthy"],
+    )
+    def test_ratio(self, cum_vlm, n_requests, expected):
+        rl = RateLimitBudget(cum_vlm=cum_vlm, n_requests=n_requests)
+        assert rl.ratio == expected
 
 
 class TestMutations:
-    def test_on_request_default(self):
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"), [({}, 1), ({"n": 3}, 3)], ids=["default", "explicit"],
+    )
+    def test_on_request(self, kwargs, expected):
         rl = RateLimitBudget()
-        rl.on_request()
-        assert rl.n_requests == 1
-
-    def test_on_request_explicit(self):
+        rl.on_request(**kwargs)
+        assert rl.n_requests == expected
+
+    @pytest.mark.parametrize(
+        ("fills", "expected"), [([50.0], 50.0), ([100.0, 200.0], 300.0)],
+        ids=["single", "accumulates"],
+    )
+    def test_on_fill(self, fills, expected):
         rl = RateLimitBudget()
-        rl.on_request(n=3)
-        assert rl.n_requests == 3
-
-    def test_on_fill_single(self):
-        rl = RateLimitBudget()
-        rl.on_fill(50.0)
-        assert rl.cum_vlm == 50.0
-
-    def test_on_fill_accumulates(self):
-        rl = RateLimitBudget()
-        rl.on_fill(100.0)
-        rl.on_fill(200.0)
-        assert rl.cum_vlm == 300.0
+        for volume in fills:
+            rl.on_fill(volume)
+        assert rl.cum_vlm == expected
 
     def test_sync_from_exchange(self):
         rl = RateLimitBudget(cum_vlm=500.0, n_requests=400)
@@ -70,6 +66,25 @@ class TestMutations:
         assert rl.n_requests == 450
 
 
+class TestTryReserve:
+    def test_reserve_debits_when_covered(self):
+        rl = RateLimitBudget()
+        assert rl.try_reserve(2, min_remaining=103) is True
+        assert rl.remaining() == 9_998
+
+    def test_reserve_refused_below_threshold(self):
+        rl = RateLimitBudget()
+        rl.on_request(9_898)  # remaining = 102
+        assert rl.try_reserve(2, min_remaining=103) is False
+        assert rl.remaining() == 102
+
+    def test_reserve_at_threshold(self):
+        rl = RateLimitBudget()
+        rl.on_request(9_897)  # remaining = 103
+        assert rl.try_reserve(min_remaining=103) is True
+        assert rl.n_requests == 9_898
+
+
 class TestHealthChecks:
     def test_is_healthy_true(self):
         rl = RateLimitBudget(cum_vlm=1000.0, n_requests=800)
@@ -93,6 +108,20 @@ class TestHealthChecks:
         rl.on_request(9_960)  # budget = 40, below custom margin of 50
         assert rl.is_emergency() is True
 
+    def test_is_emergency_fractional_budget_at_margin(self):
+        rl = RateLimitBudget(cum_vlm=0.5)
+        rl.on_request(9_500)  # budget = 500.5, remaining() = 500
+        assert rl.is_emergency() is False
+        rl.on_request(1)  # budget = 499.5
+        assert rl.is_emergency() is True
+
+    def test_is_critical(self):
+        rl = RateLimitBudget()
+        rl.on_request(9_850)  # budget = 150: emergency, not yet critical
+        assert rl.is_critical() is False
+        rl.on_request(100)  # budget = 50, below CRITICAL_MARGIN of 100
+        assert rl.is_critical() is True
+
 
 class TestLogStatus:
     def test_log_status_format(self):
@@ -108,3 +137,7 @@ class TestLogStatus:
         status = rl.log_status()
         assert "ratio=1.12" in status
         assert "reqs=522489" in status
+
+    def test_str_matches_log_status(self):
+        rl = RateLimitBudget(cum_vlm=583479.0, n_requests=522489)
+        assert str(rl) == rl.log_status()
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+import threading
 from unittest.mock import MagicMock
 
 import pytest
 
-from pyperliquidity.ws_state import WsState
+from pyperliquidity.pricing_grid import PricingGrid, cached_grid
+from pyperliquidity.ws_state import WsState, _next_slot
 
 # --- Helpers ------------------------------------------------------------------
 
@@ -104,6 +107,65 @@ async def test_startup_resolves_asset_id():
     assert ws.asset_id == 10_005
 
 
+async def test_startup_reuses_prefetched_spot_meta():
+    """A spot_meta passed at construction is used as-is, not refetched."""
+    info = _make_info(spot_index=7)
+    spot_meta = info.spot_meta.return_value
+    info.spot_meta.reset_mock()
+    ws = WsState(
+        coin="TEST", start_px=1.0, n_orders=10, order_sz=10.0,
+        info=info, exchange=MagicMock(), address="0xtest",
+        spot_meta=spot_meta,
+    )
+    await ws._startup()
+
+    info.spot_meta.assert_not_called()
+    assert ws.asset_id == 10_007
+
+
+async def test_startup_rest_calls_run_on_rest_workers():
+    """Blocking REST calls run on WsState's dedicated worker threads."""
+    info = _make_info()
+    seen: set[str] = set()
+
+    def record(result: object):
+        def call(*args: object) -> object:
+            seen.add(threading.current_thread().name)
+            return result
+        return call
+
+    info.open_orders.side_effect = record([])
+    info.spot_user_state.side_effect = record(info.spot_user_state.return_value)
+    info.user_rate_limit.side_effect = record(info.user_rate_limit.return_value)
+    ws, _, _ = _make_ws_state(info=info)
+    await ws._startup()
+
+    assert seen
+    assert all(name.startswith("rest") for name in seen)
+
+
+async def test_startup_rest_reads_overlap():
+    """open_orders and spot_user_state are in flight at the same time."""
+    info = _make_info()
+    barrier = threading.Barrier(2, timeout=5)
+    balances = info.spot_user_state.return_value
+
+    def open_orders(*args: object) -> list:
+        barrier.wait()
+        return []
+
+    def spot_user_state(*args: object) -> dict:
+        barrier.wait()
+        return balances
+
+    info.open_orders.side_effect = open_orders
+    info.spot_user_state.side_effect = spot_user_state
+    ws, _, _ = _make_ws_state(info=info)
+    await ws._startup()  # sequential calls would break the barrier
+
+    assert ws.inventory is not None
+
+
 async def test_startup_coin_not_found():
     """Raises ValueError if coin is not in spot_meta universe."""
     info = _make_info()
@@ -128,6 +190,15 @@ async def test_startup_constructs_grid():
     assert ws.grid.levels[0] == 0.020777
 
 
+async def test_startup_shares_cached_grid():
+    """Startup takes the shared grid instead of rebuilding the ladder."""
+    ws, _, _ = _make_ws_state()
+    await ws._startup()
+
+    assert ws.grid is cached_grid(start_px=1.0, n_orders=10)
+    assert ws.grid.levels == PricingGrid(start_px=1.0, n_orders=10).levels
+
+
 async def test_startup_seeds_order_state():
     """open_orders seeds OrderState with resting orders."""
     open_orders = [
@@ -224,6 +295,37 @@ async def test_tick_uses_grid_not_floating_mid():
     assert ws.grid is not None
 
 
+async def test_tick_skips_diff_when_inputs_and_book_unchanged(monkeypatch):
+    """A quiet tick followed by an identical one skips compute_diff."""
+    from pyperliquidity import ws_state as ws_state_mod
+
+    ws, _, exchange = _make_ws_state(
+        info=_make_info(token_bal=0.0, usdc_bal=0.0),
+    )
+    await ws._startup()
+
+    calls = []
+    real_compute_diff = ws_state_mod.compute_diff
+
+    def counting_compute_diff(**kwargs):
+        calls.append(kwargs)
+        return real_compute_diff(**kwargs)
+
+    monkeypatch.setattr(ws_state_mod, "compute_diff", counting_compute_diff)
+
+    await ws._tick()
+    await ws._tick()
+    assert len(calls) == 1
+
+    # Any book mutation invalidates the shortcut.
+    ws.order_state.on_place_confirmed(
+        oid=500, side="buy", level_index=3, price=1.0, size=10.0,
+    )
+    exchange.bulk_cancel.return_value = _ok([{}])
+    await ws._tick()
+    assert len(calls) == 2
+
+
 # --- 6.3 Reconciliation ------------------------------------------------------
 
 async def test_reconciliation_cancels_orphaned_order():
@@ -287,6 +389,23 @@ async def test_reconciliation_updates_balances():
     assert ws.inventory.account_usdc == 600.0
 
 
+async def test_reconciliation_missing_coin_defaults_to_zero():
+    """A coin absent from the REST balances reconciles to zero."""
+    ws, info, _ = _make_ws_state(info=_make_info(token_bal=100.0, usdc_bal=500.0))
+    await ws._startup()
+
+    info.spot_user_state.return_value = {
+        "balances": [{"coin": "USDC", "total": "600.0"}],
+    }
+    info.open_orders.return_value = []
+
+    await ws._reconcile()
+
+    assert ws.inventory is not None
+    assert ws.inventory.account_token == 0.0
+    assert ws.inventory.account_usdc == 600.0
+
+
 # --- 6.4 WS callback routing -------------------------------------------------
 
 async def test_fill_callback_updates_order_state_and_inventory():
@@ -368,6 +487,46 @@ async def test_duplicate_fill_ignored():
     assert ws.inventory.virtual_token == token_after_first
 
 
+async def test_malformed_fill_does_not_drop_earlier_fills():
+    """Fills applied before a malformed one still reach Inventory."""
+    ws, _, _ = _make_ws_state(
+        info=_make_info(token_bal=100.0, usdc_bal=500.0),
+        allocated_token=100.0,
+        allocated_usdc=500.0,
+    )
+    await ws._startup()
+
+    ws.order_state.on_place_confirmed(
+        oid=42, side="sell", level_index=5, price=1.015, size=20.0,
+    )
+    ws.order_state.on_place_confirmed(
+        oid=43, side="sell", level_index=6, price=1.02, size=20.0,
+    )
+    assert ws.inventory is not None
+    token_before = ws.inventory.virtual_token
+
+    good = {"tid": 2001, "oid": 42, "sz": "10.0", "px": "1.015"}
+    bad = {"tid": 2002, "oid": 43, "sz": "5.0", "px": "bad"}
+    with pytest.raises(ValueError):
+        await ws._handle_fill({"user": "0xtest", "fills": [good, bad]})
+
+    assert ws.inventory.virtual_token == token_before - 10.0
+
+
+async def test_rejected_fill_price_and_fee_not_parsed():
+    """Fills OrderState rejects never have their px/fee parsed."""
+    ws, _, _ = _make_ws_state()
+    await ws._startup()
+    assert ws.inventory is not None
+    token_before = ws.inventory.virtual_token
+
+    # Unknown oid: px and fee are garbage, which would raise if parsed
+    fill = {"tid": 2001, "oid": 999, "sz": "1.0", "px": "n/a", "fee": "n/a"}
+    await ws._handle_fill({"user": "0xtest", "fills": [fill]})
+
+    assert ws.inventory.virtual_token == token_before
+
+
 async def test_order_update_resting_adds_to_state():
     """orderUpdates with status=resting adds order to state."""
     ws, _, _ = _make_ws_state()
@@ -482,6 +641,7 @@ async def test_balance_update_handler():
         ],
     }
     await ws._handle_balance_update(msg)
+    ws._apply_pending_balance()
 
     assert ws.inventory is not None
     assert ws.inventory.account_token == 90.0
@@ -504,12 +664,50 @@ async def test_balance_update_sdk_wrapper_unwrapped():
         },
     }
     await ws._handle_balance_update(msg)
+    ws._apply_pending_balance()
 
     assert ws.inventory is not None
     assert ws.inventory.account_token == 80.0
     assert ws.inventory.account_usdc == 600.0
 
 
+async def test_balance_updates_are_debounced_until_tick():
+    """A burst of webData2 updates applies only the latest, at tick time."""
+    ws, _, _ = _make_ws_state(info=_make_info(token_bal=100.0, usdc_bal=500.0))
+    await ws._startup()
+
+    for token in ("90.0", "85.0"):
+        await ws._handle_balance_update({"spotBalances": [
+            {"coin": BASE_TOKEN_NAME, "total": token},
+            {"coin": "USDC", "total": "550.0"},
+        ]})
+
+    assert ws.inventory is not None
+    assert ws.inventory.account_token == 100.0  # nothing applied yet
+
+    await ws._tick()
+
+    assert ws.inventory.account_token == 85.0
+    assert ws.inventory.account_usdc == 550.0
+
+
+async def test_reconcile_supersedes_pending_balance():
+    """REST balances from reconcile drop an older pending webData2 update."""
+    ws, _, _ = _make_ws_state(info=_make_info(token_bal=100.0, usdc_bal=500.0))
+    await ws._startup()
+
+    await ws._handle_balance_update({"spotBalances": [
+        {"coin": BASE_TOKEN_NAME, "total": "10.0"},
+        {"coin": "USDC", "total": "10.0"},
+    ]})
+    await ws._reconcile()
+    ws._apply_pending_balance()
+
+    assert ws.inventory is not None
+    assert ws.inventory.account_token == 100.0
+    assert ws.inventory.account_usdc == 500.0
+
+
 async def test_fill_flat_list_still_works():
     """Flat list of fills is still handled for backward compatibility."""
     ws, _, _ = _make_ws_state(info=_make_info(token_bal=100.0, usdc_bal=500.0))
@@ -589,6 +787,53 @@ async def test_reconnect_resubscribes_and_reconciles():
     assert info.open_orders.call_count >= 1
 
 
+async def test_sync_callbacks_from_thread_are_drained_in_order():
+    """Messages posted from the SDK thread are applied in arrival order."""
+    ws, _, _ = _make_ws_state()
+    await ws._startup()
+    drain = asyncio.create_task(ws._drain_inbox())
+
+    def update(status: str, oid: int, side: str, px: str) -> dict:
+        return {"data": [{"status": status, "order": {
+            "oid": oid, "side": side, "limitPx": px, "sz": "10.0",
+        }}]}
+
+    def post_burst() -> None:
+        ws._on_order_update_sync(update("resting", 77, "B", "1.0"))
+        ws._on_order_update_sync(update("canceled", 77, "B", "1.0"))
+        ws._on_order_update_sync(update("resting", 79, "A", "1.003"))  # sentinel
+
+    await asyncio.to_thread(post_burst)
+    for _ in range(100):
+        if 79 in ws.order_state.orders_by_oid:
+            break
+        await asyncio.sleep(0.001)
+    drain.cancel()
+
+    assert 79 in ws.order_state.orders_by_oid
+    assert 77 not in ws.order_state.orders_by_oid
+
+
+async def test_inbox_survives_handler_error():
+    """A failing handler is logged and later messages still run."""
+    ws, _, _ = _make_ws_state()
+    await ws._startup()
+    drain = asyncio.create_task(ws._drain_inbox())
+
+    async def boom(msg: object) -> None:
+        raise RuntimeError("boom")
+
+    ws._post(boom, None)
+    ws._on_order_update_sync({"data": [{"status": "resting", "order": {
+        "oid": 78, "side": "A", "limitPx": "1.003", "sz": "10.0",
+    }}]})
+    for _ in range(5):
+        await asyncio.sleep(0)
+    drain.cancel()
+
+    assert 78 in ws.order_state.orders_by_oid
+
+
 # --- 6.5 Canceled order update -----------------------------------------------
 
 async def test_order_update_canceled_removes_from_state():
@@ -781,9 +1026,46 @@ async def test_run_registers_signal_handlers():
     assert ws._shutting_down is True
 
 
+async def test_run_releases_resources_when_startup_fails():
+    """A failing startup still shuts the REST pool and closes the WebSocket."""
+    ws, info, _ = _make_ws_state()
+
+    async def failing_startup() -> None:
+        raise RuntimeError("boom")
+
+    ws._startup = failing_startup  # type: ignore[assignment]
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await ws.run()
+
+    assert ws._rest_executor._shutdown
+    info.disconnect_websocket.assert_called_once()
+
+
+async def test_run_awaits_cancelled_inbox_task():
+    """run() leaves no inbox drain task pending once it returns."""
+    ws, _, exchange = _make_ws_state()
+    original_startup = ws._startup
+
+    async def startup_and_stop() -> None:
+        await original_startup()
+        ws._shutting_down = True
+
+    ws._startup = startup_and_stop  # type: ignore[assignment]
+    exchange.bulk_cancel.return_value = _ok([])
+
+    await ws.run()
+
+    assert not [
+        t for t in asyncio.all_tasks()
+        if t.get_coro().__name__ == "_drain_inbox"  # type: ignore[union-attr]
+    ]
+
+
 async def test_shutting_down_flag_stops_tick_loop():
     """Setting _shutting_down causes _tick_loop to exit."""
-    ws, info, exchange = _make_ws_state()
+    # A short interval: the loop only re-checks the flag after each sleep.
+    ws, info, exchange = _make_ws_state(interval_s=0.01)
     await ws._startup()
 
     exchange.bulk_orders.return_value = _ok([])
@@ -802,6 +1084,64 @@ async def test_shutting_down_flag_stops_tick_loop():
     assert ws._shutting_down is True
 
 
+def test_next_slot_keeps_fixed_spacing():
+    """A tick shorter than the interval moves to the very next slot."""
+    assert _next_slot(slot=0, elapsed=1.2, interval=3.0) == 1
+    assert _next_slot(slot=1, elapsed=3.5, interval=3.0) == 2
+
+
+def test_next_slot_on_time_never_skips():
+    """On-time ticks never look like overruns, whatever the float interval."""
+    for k in range(1000):
+        assert _next_slot(slot=k, elapsed=k * 0.3 + 0.01, interval=0.3) == k + 1
+
+
+def test_next_slot_skips_missed_slots():
+    """An overrunning tick resumes on the schedule without catch-up ticks."""
+    assert _next_slot(slot=0, elapsed=7.0, interval=3.0) == 3
+    assert _next_slot(slot=0, elapsed=3.0, interval=3.0) == 2
+    assert _next_slot(slot=1, elapsed=0.6, interval=0.3) == 3
+
+
+async def test_tick_loop_spacing_excludes_tick_time():
+    """Slow ticks do not stretch the interval between tick starts."""
+    ws, _, _ = _make_ws_state(interval_s=0.05)
+    await ws._startup()
+    loop = asyncio.get_running_loop()
+    starts: list[float] = []
+
+    async def slow_tick() -> None:
+        starts.append(loop.time())
+        await asyncio.sleep(0.03)
+        if len(starts) == 4:
+            ws._shutting_down = True
+
+    ws._tick = slow_tick  # type: ignore[method-assign]
+    await ws._tick_loop()
+
+    # Sleeping a full interval after each tick would take >= 3 * 0.08s
+    assert starts[-1] - starts[0] < 3 * 0.075
+
+
+async def test_tick_loop_on_time_ticks_report_no_overrun(caplog):
+    """Ticks that finish inside their slot never log an overrun."""
+    ws, _, _ = _make_ws_state(interval_s=0.03)
+    await ws._startup()
+    ticks = 0
+
+    async def quick_tick() -> None:
+        nonlocal ticks
+        ticks += 1
+        if ticks == 5:
+            ws._shutting_down = True
+
+    ws._tick = quick_tick  # type: ignore[method-assign]
+    with caplog.at_level(logging.WARNING, logger="pyperliquidity.ws_state"):
+        await ws._tick_loop()
+
+    assert "overran" not in caplog.text
+
+
 async def test_second_signal_is_ignored():
     """Second signal does not re-trigger shutdown, just logs warning."""
     ws, info, exchange = _make_ws_state()